@@ -8,10 +8,31 @@ This script ingests Kaggle/manual datasets for:
 - Market Prices
 - Crop Health (images)
 
-Outputs cleaned datasets ready for predictive modeling.
+Outputs cleaned datasets ready for predictive modeling: CSV plus a typed
+columnar copy (Parquet by default, or Feather) with categorical crop/soil_type.
+
+Streaming mode (PREPROCESS_CHUNK_SIZE or chunksize=N) handles files larger
+than RAM: a first pass over chunks fits the scaler/encoders incrementally, a
+second pass transforms and writes output chunk by chunk.
+
+Run as a script, the independent stages execute in a process pool and a
+manifest records each stage's input/code fingerprint, so unchanged stages are
+skipped on the next run (use --force to redo everything).
+
+Fitted transformers (weather scaler, soil/crop label encoders) are saved to
+models_store/transformers as versioned artifacts: the sklearn object (.pkl)
+and a plain JSON spec (means/scales, class lists) that
+backend.services.feature_transform applies online without sklearn.
 """
 
 import os
+import json
+import time
+import pickle
+import hashlib
+import inspect
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 from sklearn.preprocessing import LabelEncoder, StandardScaler
@@ -19,7 +40,15 @@ import logging
 
 # ---------- CONFIG ----------
 DATASET_DIR = os.path.join(os.path.dirname(__file__), "../../datasets")
-OUTPUT_DIR = DATASET_DIR
+# Shared with backend.utils.dataset_io, which looks here for the cleaned copies
+OUTPUT_DIR = os.getenv("PREPROCESSED_DIR", DATASET_DIR)
+# "parquet", "feather" or "none" (CSV only); needs pyarrow
+COLUMNAR_FORMAT = os.getenv("COLUMNAR_FORMAT", "parquet").lower()
+CATEGORICAL_COLUMNS = ["crop", "soil_type"]
+# Rows per chunk for streaming mode; 0 loads each file into memory at once
+CHUNK_SIZE = int(os.getenv("PREPROCESS_CHUNK_SIZE", 0))
+MODELS_DIR = os.path.join(os.path.dirname(__file__), "../../models_store")
+TRANSFORMERS_DIR = os.path.join(MODELS_DIR, "transformers")
 
 logging.basicConfig(
     level=logging.INFO,
@@ -27,8 +56,75 @@ logging.basicConfig(
     handlers=[logging.StreamHandler()]
 )
 
+# ---------- OUTPUT ----------
+def save_clean(df, filename):
+    """
+    Write a cleaned dataset as CSV and, if enabled, as a typed columnar file
+    next to it (same name, .parquet/.feather) that readers load instead.
+    """
+    out_path = os.path.join(OUTPUT_DIR, filename)
+    df.to_csv(out_path, index=False)
+
+    if COLUMNAR_FORMAT in ("parquet", "feather"):
+        typed = df.copy()
+        for col in CATEGORICAL_COLUMNS:
+            if col in typed.columns:
+                typed[col] = typed[col].astype("category")
+        columnar_path = f"{os.path.splitext(out_path)[0]}.{COLUMNAR_FORMAT}"
+        try:
+            if COLUMNAR_FORMAT == "parquet":
+                typed.to_parquet(columnar_path, index=False)
+            else:
+                typed.reset_index(drop=True).to_feather(columnar_path)
+            logging.info(f"Columnar copy saved to {columnar_path}")
+        except (ImportError, ValueError) as e:
+            logging.warning(f"Columnar output skipped for {filename}: {e}")
+    return out_path
+
+# ---------- FITTED TRANSFORMERS ----------
+def scaler_spec(scaler, columns):
+    """Plain-data form of a fitted StandardScaler."""
+    return {
+        "kind": "standard_scaler",
+        "columns": list(columns),
+        "mean": scaler.mean_.tolist(),
+        "scale": scaler.scale_.tolist(),
+    }
+
+def encoder_spec(encoder, column):
+    """Plain-data form of a fitted LabelEncoder."""
+    return {"kind": "label_encoder", "column": column, "classes": encoder.classes_.tolist()}
+
+def save_transformer(name, transformer, spec, directory=TRANSFORMERS_DIR):
+    """
+    Save a fitted transformer as <name>-<version>.pkl plus a .json spec, and
+    copy the spec to <name>.json as the current version. The version is a
+    hash of the spec, so refitting on identical data reuses the same artifact.
+    Returns the version.
+    """
+    os.makedirs(directory, exist_ok=True)
+    version = hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()[:12]
+    record = {**spec, "name": name, "version": version, "fitted_at": time.time()}
+    base = os.path.join(directory, f"{name}-{version}")
+
+    with open(f"{base}.pkl", "wb") as f:
+        pickle.dump(transformer, f)
+    with open(f"{base}.json", "w") as f:
+        json.dump(record, f, indent=2)
+
+    # Stages run in parallel processes, so each name has its own pointer file
+    current_path = os.path.join(directory, f"{name}.json")
+    tmp_path = f"{current_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(record, f, indent=2)
+    os.replace(tmp_path, current_path)
+    logging.info(f"Transformer {name} saved as version {version}")
+    return version
+
 # ---------- WEATHER DATA ----------
-def preprocess_weather(path=os.path.join(DATASET_DIR, "weather.csv"), save=True):
+def preprocess_weather(path=os.path.join(DATASET_DIR, "weather.csv"), save=True, chunksize=None):
+    if chunksize:
+        return stream_weather(path, save, chunksize)
     try:
         df = pd.read_csv(path)
         logging.info(f"Weather dataset loaded: {df.shape[0]} rows, {df.shape[1]} cols")
@@ -43,10 +139,11 @@ def preprocess_weather(path=os.path.join(DATASET_DIR, "weather.csv"), save=True)
             scaler = StandardScaler()
             df[num_cols] = scaler.fit_transform(df[num_cols])
             logging.info("Weather features normalized.")
+            if save:
+                save_transformer("weather_scaler", scaler, scaler_spec(scaler, num_cols))
 
         if save:
-            out_path = os.path.join(OUTPUT_DIR, "weather_clean.csv")
-            df.to_csv(out_path, index=False)
+            out_path = save_clean(df, "weather_clean.csv")
             logging.info(f"Weather data saved to {out_path}")
 
         return df
@@ -55,7 +152,9 @@ def preprocess_weather(path=os.path.join(DATASET_DIR, "weather.csv"), save=True)
         return pd.DataFrame()
 
 # ---------- SOIL DATA ----------
-def preprocess_soil(path=os.path.join(DATASET_DIR, "soil.csv"), save=True):
+def preprocess_soil(path=os.path.join(DATASET_DIR, "soil.csv"), save=True, chunksize=None):
+    if chunksize:
+        return stream_soil(path, save, chunksize)
     try:
         df = pd.read_csv(path)
         logging.info(f"Soil dataset loaded: {df.shape[0]} rows, {df.shape[1]} cols")
@@ -65,10 +164,11 @@ def preprocess_soil(path=os.path.join(DATASET_DIR, "soil.csv"), save=True):
             encoder = LabelEncoder()
             df["soil_type_encoded"] = encoder.fit_transform(df["soil_type"])
             logging.info("Soil types encoded.")
+            if save:
+                save_transformer("soil_type_encoder", encoder, encoder_spec(encoder, "soil_type"))
 
         if save:
-            out_path = os.path.join(OUTPUT_DIR, "soil_clean.csv")
-            df.to_csv(out_path, index=False)
+            out_path = save_clean(df, "soil_clean.csv")
             logging.info(f"Soil data saved to {out_path}")
 
         return df
@@ -77,7 +177,9 @@ def preprocess_soil(path=os.path.join(DATASET_DIR, "soil.csv"), save=True):
         return pd.DataFrame()
 
 # ---------- CROP YIELD DATA ----------
-def preprocess_crop_yield(path=os.path.join(DATASET_DIR, "crop_yield.csv"), save=True):
+def preprocess_crop_yield(path=os.path.join(DATASET_DIR, "crop_yield.csv"), save=True, chunksize=None):
+    if chunksize:
+        return stream_crop_yield(path, save, chunksize)
     try:
         df = pd.read_csv(path)
         logging.info(f"Crop yield dataset loaded: {df.shape[0]} rows, {df.shape[1]} cols")
@@ -88,8 +190,7 @@ def preprocess_crop_yield(path=os.path.join(DATASET_DIR, "crop_yield.csv"), save
             logging.info("Feature engineered: rainfall_per_acre.")
 
         if save:
-            out_path = os.path.join(OUTPUT_DIR, "crop_yield_clean.csv")
-            df.to_csv(out_path, index=False)
+            out_path = save_clean(df, "crop_yield_clean.csv")
             logging.info(f"Crop yield data saved to {out_path}")
 
         return df
@@ -98,7 +199,9 @@ def preprocess_crop_yield(path=os.path.join(DATASET_DIR, "crop_yield.csv"), save
         return pd.DataFrame()
 
 # ---------- MARKET DATA ----------
-def preprocess_market(path=os.path.join(DATASET_DIR, "market_prices.csv"), save=True):
+def preprocess_market(path=os.path.join(DATASET_DIR, "market_prices.csv"), save=True, chunksize=None):
+    if chunksize:
+        return stream_market(path, save, chunksize)
     try:
         df = pd.read_csv(path)
         logging.info(f"Market dataset loaded: {df.shape[0]} rows, {df.shape[1]} cols")
@@ -111,10 +214,11 @@ def preprocess_market(path=os.path.join(DATASET_DIR, "market_prices.csv"), save=
             encoder = LabelEncoder()
             df["crop_encoded"] = encoder.fit_transform(df["crop"])
             logging.info("Crop names encoded.")
+            if save:
+                save_transformer("crop_encoder", encoder, encoder_spec(encoder, "crop"))
 
         if save:
-            out_path = os.path.join(OUTPUT_DIR, "market_prices_clean.csv")
-            df.to_csv(out_path, index=False)
+            out_path = save_clean(df, "market_prices_clean.csv")
             logging.info(f"Market data saved to {out_path}")
 
         return df
@@ -122,6 +226,189 @@ def preprocess_market(path=os.path.join(DATASET_DIR, "market_prices.csv"), save=
         logging.error(f"Error preprocessing market data: {e}")
         return pd.DataFrame()
 
+# ---------- STREAMING MODE ----------
+class ChunkWriter:
+    """
+    Append cleaned chunks to the output CSV and, for Parquet, to a columnar
+    file through a single ParquetWriter. Categorical columns are written as
+    dictionary columns, so the file reads back with the category dtype that
+    save_clean produces.
+    """
+
+    def __init__(self, filename):
+        self.out_path = os.path.join(OUTPUT_DIR, filename)
+        self.columnar_path = None
+        self._parquet = None
+        self._schema = None
+        self._first = True
+        if COLUMNAR_FORMAT == "parquet":
+            self.columnar_path = f"{os.path.splitext(self.out_path)[0]}.parquet"
+        elif COLUMNAR_FORMAT == "feather":
+            logging.warning("Feather output is not supported in streaming mode; writing CSV only.")
+
+    def write(self, chunk):
+        chunk.to_csv(self.out_path, mode="w" if self._first else "a", header=self._first, index=False)
+        self._first = False
+        if self.columnar_path:
+            self._write_columnar(chunk)
+
+    def _write_columnar(self, chunk):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            typed = chunk.copy()
+            for col in CATEGORICAL_COLUMNS:
+                if col in typed.columns:
+                    typed[col] = typed[col].astype("category")
+            table = pa.Table.from_pandas(typed, preserve_index=False)
+            if self._parquet is None:
+                # Chunks see different category counts (int8 vs int16 codes);
+                # fix the dictionary index width so every chunk fits one schema
+                self._schema = pa.schema([
+                    field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+                    if pa.types.is_dictionary(field.type) else field
+                    for field in table.schema
+                ], metadata=table.schema.metadata)
+                self._parquet = pq.ParquetWriter(self.columnar_path, self._schema)
+            self._parquet.write_table(table.cast(self._schema))
+        except (ImportError, ValueError, TypeError) as e:
+            # pyarrow missing or dtypes drifted between chunks: keep the CSV only
+            logging.warning(f"Columnar output skipped for {self.out_path}: {e}")
+            self._abandon_columnar()
+
+    def _abandon_columnar(self):
+        if self._parquet is not None:
+            self._parquet.close()
+        if self.columnar_path and os.path.exists(self.columnar_path):
+            os.remove(self.columnar_path)
+        self._parquet = None
+        self.columnar_path = None
+
+    def close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+        if self._first:
+            # No rows survived cleaning; still leave an (empty) output file
+            open(self.out_path, "w").close()
+
+def _clean_chunks(path, chunksize, parse_dates=False):
+    """Yield chunks of `path` with NaN rows (and bad dates) dropped."""
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        chunk = chunk.dropna()
+        if parse_dates and "date" in chunk.columns:
+            chunk["date"] = pd.to_datetime(chunk["date"], errors="coerce")
+            chunk = chunk.dropna(subset=["date"])
+        if not chunk.empty:
+            yield chunk
+
+def _stream_stage(name, path, filename, chunksize, transform, fit=None, parse_dates=False, save=True):
+    """
+    Run one streaming stage: optional fit pass, then transform-and-write pass.
+    Peak memory is bounded by the chunk size. Returns rows written and path.
+    """
+    if fit is not None:
+        for chunk in _clean_chunks(path, chunksize, parse_dates):
+            fit(chunk)
+
+    writer = ChunkWriter(filename) if save else None
+    rows = 0
+    for chunk in _clean_chunks(path, chunksize, parse_dates):
+        chunk = transform(chunk)
+        rows += len(chunk)
+        if writer is not None:
+            writer.write(chunk)
+    if writer is not None:
+        writer.close()
+        logging.info(f"{name} data streamed to {writer.out_path} ({rows} rows)")
+    return {"rows": rows, "out_path": writer.out_path if writer else None}
+
+def _fit_label_encoder(path, column, chunksize, parse_dates=False):
+    """LabelEncoder fitted on the distinct values of `column` across all chunks."""
+    values = set()
+    for chunk in _clean_chunks(path, chunksize, parse_dates):
+        if column in chunk.columns:
+            values.update(chunk[column].unique())
+    if not values:
+        return None
+    encoder = LabelEncoder()
+    encoder.fit(np.array(sorted(values)))
+    return encoder
+
+def stream_weather(path=os.path.join(DATASET_DIR, "weather.csv"), save=True, chunksize=CHUNK_SIZE):
+    """Streaming preprocess_weather: StandardScaler fitted with partial_fit."""
+    try:
+        scaler = StandardScaler()
+        fitted = []
+
+        def fit(chunk):
+            cols = [c for c in ["temperature", "humidity", "rainfall"] if c in chunk.columns]
+            if cols:
+                scaler.partial_fit(chunk[cols])
+                fitted[:] = cols
+
+        def transform(chunk):
+            if fitted:
+                chunk[fitted] = scaler.transform(chunk[fitted])
+            return chunk
+
+        result = _stream_stage("Weather", path, "weather_clean.csv", chunksize,
+                               transform, fit=fit, parse_dates=True, save=save)
+        if save and fitted:
+            save_transformer("weather_scaler", scaler, scaler_spec(scaler, fitted))
+        return result
+    except Exception as e:
+        logging.error(f"Error streaming weather data: {e}")
+        return {"rows": 0, "out_path": None}
+
+def stream_soil(path=os.path.join(DATASET_DIR, "soil.csv"), save=True, chunksize=CHUNK_SIZE):
+    """Streaming preprocess_soil: soil types collected in a first pass."""
+    try:
+        encoder = _fit_label_encoder(path, "soil_type", chunksize)
+        if save and encoder is not None:
+            save_transformer("soil_type_encoder", encoder, encoder_spec(encoder, "soil_type"))
+
+        def transform(chunk):
+            if encoder is not None and "soil_type" in chunk.columns:
+                chunk["soil_type_encoded"] = encoder.transform(chunk["soil_type"])
+            return chunk
+
+        return _stream_stage("Soil", path, "soil_clean.csv", chunksize, transform, save=save)
+    except Exception as e:
+        logging.error(f"Error streaming soil data: {e}")
+        return {"rows": 0, "out_path": None}
+
+def stream_crop_yield(path=os.path.join(DATASET_DIR, "crop_yield.csv"), save=True, chunksize=CHUNK_SIZE):
+    """Streaming preprocess_crop_yield: single pass, nothing to fit."""
+    try:
+        def transform(chunk):
+            if set(["rainfall", "acreage"]).issubset(chunk.columns):
+                chunk["rainfall_per_acre"] = chunk["rainfall"] / chunk["acreage"].replace(0, np.nan)
+            return chunk
+
+        return _stream_stage("Crop yield", path, "crop_yield_clean.csv", chunksize, transform, save=save)
+    except Exception as e:
+        logging.error(f"Error streaming crop yield data: {e}")
+        return {"rows": 0, "out_path": None}
+
+def stream_market(path=os.path.join(DATASET_DIR, "market_prices.csv"), save=True, chunksize=CHUNK_SIZE):
+    """Streaming preprocess_market: crop names collected in a first pass."""
+    try:
+        encoder = _fit_label_encoder(path, "crop", chunksize, parse_dates=True)
+        if save and encoder is not None:
+            save_transformer("crop_encoder", encoder, encoder_spec(encoder, "crop"))
+
+        def transform(chunk):
+            if encoder is not None and "crop" in chunk.columns:
+                chunk["crop_encoded"] = encoder.transform(chunk["crop"])
+            return chunk
+
+        return _stream_stage("Market", path, "market_prices_clean.csv", chunksize,
+                             transform, parse_dates=True, save=save)
+    except Exception as e:
+        logging.error(f"Error streaming market data: {e}")
+        return {"rows": 0, "out_path": None}
+
 # ---------- CROP HEALTH (IMAGE DATA) ----------
 def preprocess_crop_health(path=os.path.join(DATASET_DIR, "crop_images/")):
     """
@@ -137,14 +424,135 @@ def preprocess_crop_health(path=os.path.join(DATASET_DIR, "crop_images/")):
     logging.info("Crop health preprocessing will be handled in Phase 3 CNN pipeline.")
     return None
 
+# ---------- PIPELINE RUNNER ----------
+# Bump to invalidate every stage's cached output for changes the code hash
+# below cannot see (library upgrades, dataset semantics)
+PIPELINE_VERSION = "1"
+# Helpers every stage goes through; their source is part of each fingerprint
+SHARED_HELPERS = (save_clean, ChunkWriter, _clean_chunks, _stream_stage, _fit_label_encoder,
+                  scaler_spec, encoder_spec, save_transformer)
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, "preprocess_manifest.json")
+
+# name: (stage function, input file, cleaned output file)
+STAGES = {
+    "weather": (preprocess_weather, os.path.join(DATASET_DIR, "weather.csv"), "weather_clean.csv"),
+    "soil": (preprocess_soil, os.path.join(DATASET_DIR, "soil.csv"), "soil_clean.csv"),
+    "crop_yield": (preprocess_crop_yield, os.path.join(DATASET_DIR, "crop_yield.csv"), "crop_yield_clean.csv"),
+    "market": (preprocess_market, os.path.join(DATASET_DIR, "market_prices.csv"), "market_prices_clean.csv"),
+}
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def stage_outputs(name):
+    """The stage's cleaned CSV plus its columnar copy when COLUMNAR_FORMAT is enabled."""
+    out_path = os.path.join(OUTPUT_DIR, STAGES[name][2])
+    paths = [out_path]
+    if COLUMNAR_FORMAT in ("parquet", "feather"):
+        paths.append(f"{os.path.splitext(out_path)[0]}.{COLUMNAR_FORMAT}")
+    return paths
+
+def stage_fingerprint(name):
+    """
+    Hash of the stage's input file, its code and the shared helpers' code,
+    the pipeline version and the columnar output format (switching
+    parquet/feather redoes the stage). None if the input file is missing.
+    """
+    fn, input_path, _ = STAGES[name]
+    if not os.path.exists(input_path):
+        return None
+    code = inspect.getsource(fn)
+    stream_fn = globals().get(f"stream_{name}")
+    if stream_fn is not None:
+        code += inspect.getsource(stream_fn)
+    code += "".join(inspect.getsource(helper) for helper in SHARED_HELPERS)
+    key = (f"{PIPELINE_VERSION}:{COLUMNAR_FORMAT}:{_file_digest(input_path)}:"
+           f"{hashlib.sha256(code.encode()).hexdigest()}")
+    return hashlib.sha256(key.encode()).hexdigest()
+
+def load_manifest(path=MANIFEST_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def _run_stage(name, chunksize):
+    """Worker entry point: run one stage and report rows and wall time."""
+    fn, input_path, _ = STAGES[name]
+    start = time.perf_counter()
+    result = fn(input_path, save=True, chunksize=chunksize)
+    rows = result["rows"] if isinstance(result, dict) else len(result)
+    return {"rows": int(rows), "seconds": round(time.perf_counter() - start, 3)}
+
+def run_pipeline(stages=None, workers=None, force=False, chunksize=CHUNK_SIZE, manifest_path=MANIFEST_PATH):
+    """
+    Run the preprocessing stages in a process pool, skipping stages whose
+    fingerprint matches the manifest. Returns per-stage results.
+    """
+    stages = list(stages or STAGES)
+    manifest = load_manifest(manifest_path)
+    results = {}
+    todo = {}
+
+    for name in stages:
+        fingerprint = stage_fingerprint(name)
+        previous = manifest.get(name, {})
+        # Outputs the last run wrote; a columnar copy it could not write
+        # (pyarrow missing, Feather while streaming) is not required
+        outputs = previous.get("outputs", [STAGES[name][2]])
+        output_exists = all(os.path.exists(os.path.join(OUTPUT_DIR, f)) for f in outputs)
+        if not force and fingerprint and output_exists and previous.get("fingerprint") == fingerprint:
+            logging.info(f"Stage {name}: unchanged, skipped.")
+            results[name] = {**previous, "skipped": True}
+        else:
+            todo[name] = fingerprint
+
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers or min(len(todo), os.cpu_count() or 1)) as pool:
+            futures = {name: pool.submit(_run_stage, name, chunksize) for name in todo}
+            for name, future in futures.items():
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    logging.error(f"Stage {name} failed: {e}")
+                    results[name] = {"error": str(e), "skipped": False}
+                    continue
+                logging.info(f"Stage {name}: {outcome['rows']} rows in {outcome['seconds']}s")
+                outputs = [os.path.basename(p) for p in stage_outputs(name) if os.path.exists(p)]
+                entry = {**outcome, "fingerprint": todo[name], "outputs": outputs, "finished_at": time.time()}
+                results[name] = {**entry, "skipped": False}
+                # Stages report errors by returning no rows; don't cache those
+                if todo[name] and outcome["rows"] > 0:
+                    manifest[name] = entry
+                else:
+                    manifest.pop(name, None)
+
+    save_manifest(manifest, manifest_path)
+    return results
+
 # ---------- MAIN ----------
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run Phase 1 data preprocessing.")
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), help="Stages to run (default: all)")
+    parser.add_argument("--workers", type=int, help="Process pool size")
+    parser.add_argument("--force", action="store_true", help="Re-run stages even if unchanged")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_SIZE, help="Rows per chunk (0 = in memory)")
+    args = parser.parse_args()
+
     logging.info("Starting Phase 1 Data Preprocessing...")
 
-    weather = preprocess_weather()
-    soil = preprocess_soil()
-    crop_yield = preprocess_crop_yield()
-    market = preprocess_market()
+    results = run_pipeline(args.stages, workers=args.workers, force=args.force, chunksize=args.chunksize)
     crop_health = preprocess_crop_health()
 
-    logging.info("Phase 1 preprocessing complete.")
+    logging.info(f"Phase 1 preprocessing complete: {results}")
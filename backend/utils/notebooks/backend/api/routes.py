@@ -4,28 +4,103 @@ Phase 2: Advisory Engine + Dashboard Integration
 """
 
 import os
-from flask import Blueprint, request, jsonify
+import csv
+import json
+import functools
+from datetime import datetime, timezone
+from flask import Blueprint, request, jsonify, Response, stream_with_context, current_app
+from werkzeug.exceptions import RequestEntityTooLarge
 from backend.db import db
 from backend.models import FarmProfile, AdvisoryLog
 from backend.utils.validators import validate_farm_profile, validate_advisory, validate_crop_health_upload
-from backend.utils.file_paths import get_upload_path, ensure_directories
-from backend.services.crop_health_infer import predict_crop_health
+from backend.utils.file_paths import get_upload_path
+from backend.utils.serialization import json_response, serialize_all, compress_response
+from backend.utils.pagination import (
+    PaginationError, keyset_list, parse_limit, encode_cursor, decode_cursor, fetch_page,
+)
+from backend.services.crop_health_infer import (
+    predict_crop_health, predict_crop_health_bytes, predict_crop_health_batch,
+    batcher as crop_health_batcher, cache as crop_health_cache,
+)
+from backend.services.upload_store import (
+    UPLOAD_MAX_BYTES, UPLOAD_CHUNK_SIZE, UploadTooLargeError, UnsupportedUploadError,
+    store_stream, read_limited, upload_name, save_upload_async,
+)
+from backend.services.model_registry import registry, ModelUnavailableError
+from backend.services import tabular_models
+from backend.services.farm_import import ImportFormatError, detect_format, import_stream
+from backend.services.advisory_engine import generate_yield_forecast, advisory_rows, save_advisories
+from backend.services.resource_optimizer import optimize_irrigation
 
 # ---------- BLUEPRINT ----------
 api_blueprint = Blueprint("api", __name__)
+api_blueprint.after_request(compress_response)
+
+# ---------- CONDITIONAL GET ----------
+def _farm_validators(farm_id):
+    """(etag, last_modified) for a farm from one primary-key lookup, or None."""
+    state = (db.session.query(FarmProfile.version, FarmProfile.updated_at)
+             .filter(FarmProfile.id == farm_id).first())
+    if state is None:
+        return None
+    last_modified = state.updated_at.replace(tzinfo=timezone.utc, microsecond=0)
+    return f"farm-{farm_id}-v{state.version}", last_modified
+
+def _not_modified(etag, last_modified):
+    # If-None-Match wins over If-Modified-Since when both are sent
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    return request.if_modified_since is not None and last_modified <= request.if_modified_since
+
+def farm_conditional(view):
+    """
+    Answer GETs for an unchanged farm with 304 before the view runs its
+    query; otherwise tag the view's response with ETag/Last-Modified.
+    """
+    @functools.wraps(view)
+    def wrapper(farm_id, *args, **kwargs):
+        validators = _farm_validators(farm_id)
+        if validators is None:
+            return view(farm_id, *args, **kwargs)
+        etag, last_modified = validators
+        if _not_modified(etag, last_modified):
+            response = Response(status=304)
+        else:
+            response = current_app.make_response(view(farm_id, *args, **kwargs))
+            if response.status_code != 200:
+                return response
+        # Weak: the same version may be sent gzip/brotli encoded or not
+        response.set_etag(etag, weak=True)
+        response.last_modified = last_modified
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+    return wrapper
 
 # ---------- FARM PROFILE ROUTES ----------
+FARM_PROFILE_FILTERS = ("crop_type", "region")
+FARM_PROFILE_FIELDS = FarmProfile.SERIALIZED_FIELDS
+READ_ONLY_FIELDS = {"id", "version", "updated_at"}
+
 @api_blueprint.route("/farm-profiles", methods=["GET"])
 def list_profiles():
-    """List all farm profiles."""
-    profiles = FarmProfile.query.all()
-    return jsonify([p.to_dict() for p in profiles])
+    """
+    List farm profiles one page at a time, ordered by id.
+    Query: limit, cursor (next_cursor of the previous page), crop_type,
+    region, fields (comma-separated columns; id is always included).
+    """
+    try:
+        profiles, next_cursor = keyset_list(db.session, FarmProfile, request.args, FARM_PROFILE_FILTERS,
+                                               fields=FARM_PROFILE_FIELDS)
+    except PaginationError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    return json_response({"profiles": profiles, "next_cursor": next_cursor})
 
 @api_blueprint.route("/farm-profiles/<int:farm_id>", methods=["GET"])
+@farm_conditional
 def get_profile(farm_id):
     """Get a single farm profile by ID."""
     profile = FarmProfile.query.get_or_404(farm_id)
-    return jsonify(profile.to_dict())
+    return json_response(profile.to_dict())
 
 @api_blueprint.route("/farm-profiles", methods=["POST"])
 def add_profile():
@@ -45,7 +120,31 @@ def add_profile():
     )
     db.session.add(profile)
     db.session.commit()
-    return jsonify({"status": "success", "profile": profile.to_dict()}), 201
+    return json_response({"status": "success", "profile": profile.to_dict()}, 201)
+
+@api_blueprint.route("/farm-profiles/import", methods=["POST"])
+def import_profiles():
+    """
+    Bulk register farm profiles from CSV or NDJSON, sent as a multipart
+    "file" or as the raw request body. Query: format (csv|ndjson, default
+    from the file name or Content-Type), dry_run.
+    Invalid rows are reported per row; valid rows are still imported.
+    """
+    upload = request.files.get("file") if request.mimetype == "multipart/form-data" else None
+    stream = upload.stream if upload else request.stream
+    dry_run = request.args.get("dry_run", "").lower() in ("true", "1", "yes")
+    try:
+        fmt = request.args.get("format") or detect_format(
+            upload.filename if upload else None, upload.mimetype if upload else request.mimetype
+        )
+        summary = import_stream(stream, fmt, dry_run=dry_run)
+    except ImportFormatError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    except UnicodeDecodeError:
+        return jsonify({"status": "error", "message": "Import file must be UTF-8 text."}), 400
+    except csv.Error as e:
+        return jsonify({"status": "error", "message": f"Malformed CSV: {e}"}), 400
+    return json_response({"status": "success" if summary["failed"] == 0 else "partial", **summary})
 
 @api_blueprint.route("/farm-profiles/<int:farm_id>", methods=["PUT"])
 def update_profile(farm_id):
@@ -53,10 +152,10 @@ def update_profile(farm_id):
     profile = FarmProfile.query.get_or_404(farm_id)
     data = request.json or {}
     for key, value in data.items():
-        if hasattr(profile, key):
+        if hasattr(profile, key) and key not in READ_ONLY_FIELDS:
             setattr(profile, key, value)
     db.session.commit()
-    return jsonify({"status": "updated", "profile": profile.to_dict()})
+    return json_response({"status": "updated", "profile": profile.to_dict()})
 
 @api_blueprint.route("/farm-profiles/<int:farm_id>", methods=["DELETE"])
 def delete_profile(farm_id):
@@ -67,11 +166,54 @@ def delete_profile(farm_id):
     return jsonify({"status": "deleted", "id": farm_id})
 
 # ---------- ADVISORY ROUTES ----------
+ADVISORY_PAGE_SIZE = 20
+ADVISORY_FIELDS = ("id", "advisory_type", "message", "created_at")
+
+def _parse_timestamp(value):
+    """ISO date/datetime as naive UTC, the form created_at is stored in."""
+    try:
+        ts = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise PaginationError(f"Invalid timestamp '{value}'; use ISO 8601.")
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return ts
+
 @api_blueprint.route("/advisory/<int:farm_id>", methods=["GET"])
+@farm_conditional
 def get_advisory(farm_id):
-    """Fetch advisory logs for a farm."""
-    logs = AdvisoryLog.query.filter_by(farm_id=farm_id).all()
-    return jsonify([{"id": l.id, "advisory_type": l.advisory_type, "message": l.message} for l in logs])
+    """
+    Fetch a farm's advisories, newest first, one page at a time.
+    Query: limit, cursor (next_cursor of the previous page), since (ISO
+    timestamp, only newer items), advisory_type.
+    """
+    try:
+        limit = parse_limit(request.args.get("limit"), ADVISORY_PAGE_SIZE)
+        query = AdvisoryLog.query.filter(AdvisoryLog.farm_id == farm_id)
+        since = request.args.get("since")
+        if since:
+            query = query.filter(AdvisoryLog.created_at > _parse_timestamp(since))
+        advisory_type = request.args.get("advisory_type")
+        if advisory_type:
+            query = query.filter(AdvisoryLog.advisory_type == advisory_type)
+        cursor = request.args.get("cursor")
+        if cursor:
+            created_at, last_id = decode_cursor(cursor, 2)
+            created_at = _parse_timestamp(created_at)
+            if not isinstance(last_id, int):
+                raise PaginationError("Invalid cursor.")
+            query = query.filter(db.or_(
+                AdvisoryLog.created_at < created_at,
+                db.and_(AdvisoryLog.created_at == created_at, AdvisoryLog.id < last_id),
+            ))
+    except PaginationError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    logs, has_more = fetch_page(
+        query.order_by(AdvisoryLog.created_at.desc(), AdvisoryLog.id.desc()), limit
+    )
+    next_cursor = encode_cursor(logs[-1].created_at.isoformat(), logs[-1].id) if has_more else None
+    return json_response({"advisories": serialize_all(logs, ADVISORY_FIELDS), "next_cursor": next_cursor})
 
 @api_blueprint.route("/advisory/<int:farm_id>", methods=["POST"])
 def add_advisory(farm_id):
@@ -90,30 +232,101 @@ def add_advisory(farm_id):
     db.session.commit()
     return jsonify({"status": "success", "log_id": log.id}), 201
 
+@api_blueprint.route("/advisory/<int:farm_id>/forecast", methods=["POST"])
+def forecast_advisory(farm_id):
+    """
+    Score the farm with the yield and irrigation models and store the
+    resulting yield forecast and irrigation advisories.
+    Body: {"weather_data": {...}, "soil_data": {...}}
+    """
+    farm = FarmProfile.query.get(farm_id)
+    if not farm:
+        return jsonify({"status": "error", "message": "Farm profile not found"}), 404
+    data = request.json or {}
+    weather_data = data.get("weather_data") or {}
+    soil_data = data.get("soil_data") or {}
+
+    try:
+        yields, irrigation = tabular_models.forecast_farms([farm], [weather_data], [soil_data])
+    except tabular_models.FeatureValueError as e:
+        return jsonify({"status": "error", "message": str(e), "field": e.field}), 400
+    except ModelUnavailableError as e:
+        return jsonify({"status": "error", "message": str(e)}), 503
+
+    results = {}
+    if yields[0] is not None:
+        results["yield"] = generate_yield_forecast(farm, yields[0])
+    if irrigation[0] is not None:
+        results["irrigation"] = optimize_irrigation(farm, weather_data, irrigation[0])
+    save_advisories(advisory_rows(farm.id, results))
+    return jsonify({
+        "yield_model_output": yields[0],
+        "irrigation_model_output": irrigation[0],
+        "advisories": results,
+    }), 201
+
 # ---------- CROP HEALTH ROUTES ----------
+# Upload rows read "Image uploaded: <file>" optionally followed by "; Inference: ...";
+# the stored name itself is kept in AdvisoryLog.file_name
+UPLOAD_LOG_PREFIX = "Image uploaded: "
+UPLOAD_LOG_SEPARATOR = "; "
+
+# Allow one chunk of slack for multipart framing and form fields
+UPLOAD_BODY_LIMIT = UPLOAD_MAX_BYTES + UPLOAD_CHUNK_SIZE
+
+def _too_large_response():
+    return jsonify({"status": "error", "message": f"Image exceeds the {UPLOAD_MAX_BYTES} byte upload limit."}), 413
+
+def _upload_form():
+    """
+    (farm_id, crop_image file) for an image upload, or a 413 response.
+    The body limit is set on the request before the form is parsed, so
+    Werkzeug stops reading an oversized body, including a chunked one with
+    no Content-Length, instead of spooling it to a temp file first.
+    """
+    request.max_content_length = UPLOAD_BODY_LIMIT
+    if request.content_length and request.content_length > UPLOAD_BODY_LIMIT:
+        return None, None, _too_large_response()
+    try:
+        return request.form.get("farm_id"), request.files.get("crop_image"), None
+    except RequestEntityTooLarge:
+        return None, None, _too_large_response()
+
 @api_blueprint.route("/crop-health/upload", methods=["POST"])
 def upload_crop_health():
     """
     Upload crop health image and metadata.
+    The image is streamed to disk in chunks under a content-addressed name;
+    the stored file_name is returned for use with /crop-health/infer.
     """
-    ensure_directories()
-    farm_id = request.form.get("farm_id")
-    file = request.files.get("crop_image")
+    farm_id, file, error = _upload_form()
+    if error:
+        return error
 
     if not farm_id or not file:
         return jsonify({"status": "error", "message": "Farm ID and crop image are required."}), 400
 
-    save_path = get_upload_path(file.filename)
-    file.save(save_path)
+    try:
+        stored = store_stream(file.stream, file.filename)
+    except UploadTooLargeError as e:
+        return jsonify({"status": "error", "message": str(e)}), 413
+    except UnsupportedUploadError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
 
     log = AdvisoryLog(
         farm_id=farm_id,
         advisory_type="crop_health",
-        message=f"Image uploaded: {file.filename}"
+        message=f"{UPLOAD_LOG_PREFIX}{stored['file_name']}",
+        file_name=stored["file_name"],
     )
     db.session.add(log)
     db.session.commit()
-    return jsonify({"status": "success", "message": "Crop health image uploaded successfully."}), 201
+    return jsonify({
+        "status": "success",
+        "message": "Crop health image uploaded successfully.",
+        "file_name": stored["file_name"],
+        "deduplicated": stored["deduplicated"],
+    }), 201
 
 @api_blueprint.route("/crop-health/infer", methods=["POST"])
 def infer_crop_health():
@@ -132,7 +345,10 @@ def infer_crop_health():
     if not os.path.exists(file_path):
         return jsonify({"status": "error", "message": "File not found for inference."}), 404
 
-    result = predict_crop_health(file_path)
+    try:
+        result = predict_crop_health(file_path)
+    except ModelUnavailableError as e:
+        return jsonify({"status": "error", "message": str(e)}), 503
 
     log = AdvisoryLog(
         farm_id=farm_id,
@@ -142,3 +358,171 @@ def infer_crop_health():
     db.session.add(log)
     db.session.commit()
     return jsonify(result)
+
+@api_blueprint.route("/crop-health/analyze", methods=["POST"])
+def analyze_crop_health():
+    """
+    Upload a crop image and run CNN inference in one request.
+    The image is decoded from memory; the original is written to the upload
+    folder in the background and a single advisory row is recorded.
+    """
+    farm_id, file, error = _upload_form()
+    if error:
+        return error
+
+    if not farm_id or not file:
+        return jsonify({"status": "error", "message": "Farm ID and crop image are required."}), 400
+
+    try:
+        data = read_limited(file.stream)
+        file_name = upload_name(data, file.filename)
+    except UploadTooLargeError as e:
+        return jsonify({"status": "error", "message": str(e)}), 413
+    except UnsupportedUploadError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    try:
+        result = predict_crop_health_bytes(data)
+    except ModelUnavailableError as e:
+        return jsonify({"status": "error", "message": str(e)}), 503
+    except OSError:
+        return jsonify({"status": "error", "message": "Image could not be decoded."}), 400
+
+    save_upload_async(data, file.filename)
+
+    log = AdvisoryLog(
+        farm_id=farm_id,
+        advisory_type="crop_health",
+        message=f"{UPLOAD_LOG_PREFIX}{file_name}{UPLOAD_LOG_SEPARATOR}"
+                f"Inference: {result['status']} ({result['confidence']:.2f})",
+        file_name=file_name,
+    )
+    db.session.add(log)
+    db.session.commit()
+    return jsonify({**result, "file_name": file_name}), 201
+
+def _uploaded_file_names(farm_id):
+    """File names recorded by /crop-health/upload and /analyze for a farm, oldest first."""
+    rows = (db.session.query(AdvisoryLog.file_name)
+            .filter(AdvisoryLog.farm_id == farm_id,
+                    AdvisoryLog.advisory_type == "crop_health",
+                    AdvisoryLog.file_name.isnot(None))
+            .order_by(AdvisoryLog.id)
+            .all())
+    return list(dict.fromkeys(name for name, in rows))
+
+@api_blueprint.route("/crop-health/infer/batch", methods=["POST"])
+def infer_crop_health_batch():
+    """
+    Run CNN inference on many uploaded images for one farm.
+    Body: {"farm_id": 1, "file_names": [...]}; omit file_names to use every
+    image uploaded for the farm. Streams one NDJSON line per image as each
+    batch finishes. Each batch's advisory rows are bulk inserted before its
+    lines are sent, so a client that disconnects keeps every result it saw.
+    """
+    data = request.json or {}
+    farm_id = data.get("farm_id")
+    if not farm_id:
+        return jsonify({"status": "error", "errors": ["Farm ID is required."]}), 400
+    if isinstance(farm_id, str) and farm_id.isdigit():
+        farm_id = int(farm_id)
+    if not isinstance(farm_id, int) or isinstance(farm_id, bool):
+        return jsonify({"status": "error", "errors": ["Farm ID must be an integer."]}), 400
+
+    file_names = data.get("file_names")
+    if file_names is None:
+        file_names = _uploaded_file_names(farm_id)
+    if not isinstance(file_names, list) or not file_names:
+        return jsonify({"status": "error", "message": "No images to process."}), 400
+    if not all(isinstance(name, str) for name in file_names):
+        return jsonify({"status": "error", "message": "file_names must be a list of strings."}), 400
+
+    errors = {}
+    paths = {}
+    for name in file_names:
+        name_errors = validate_crop_health_upload({"farm_id": farm_id, "file_name": name})
+        if name_errors:
+            errors[name] = "; ".join(name_errors)
+            continue
+        path = get_upload_path(name)
+        if not os.path.exists(path):
+            errors[name] = "File not found for inference."
+            continue
+        paths[path] = name
+
+    try:
+        batches = predict_crop_health_batch(list(paths)) if paths else iter(())
+        first = next(batches, None)
+    except ModelUnavailableError as e:
+        return jsonify({"status": "error", "message": str(e)}), 503
+
+    def generate():
+        for name, message in errors.items():
+            yield json.dumps({"file_name": name, "status": "error", "message": message}) + "\n"
+
+        batch = first
+        while batch is not None:
+            rows, lines = [], []
+            for path, result in batch:
+                name = paths[path]
+                if "error" in result:
+                    lines.append(json.dumps({"file_name": name, "status": "error", "message": result["error"]}) + "\n")
+                    continue
+                rows.append({
+                    "farm_id": farm_id,
+                    "advisory_type": "crop_health",
+                    "message": f"Inference: {result['status']} ({result['confidence']:.2f})",
+                })
+                lines.append(json.dumps({"file_name": name, **result}) + "\n")
+            save_advisories(rows)
+            yield from lines
+            batch = next(batches, None)
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+# ---------- MODEL ROUTES ----------
+@api_blueprint.route("/models/status", methods=["GET"])
+def model_status():
+    """Report load state, load time and memory of registered models."""
+    return jsonify(registry.stats())
+
+@api_blueprint.route("/models/<model_name>/predict", methods=["POST"])
+def predict_tabular(model_name):
+    """
+    Score feature rows with the yield or irrigation model in one batch.
+    Body: {"rows": [{...}, ...]} or a single feature object.
+    """
+    if model_name not in tabular_models.MODEL_FEATURES:
+        return jsonify({"status": "error", "message": f"Unknown model '{model_name}'"}), 404
+    data = request.json or {}
+    rows = data.get("rows") if "rows" in data else data
+    if not isinstance(rows, (dict, list)) or (isinstance(rows, list) and not all(isinstance(r, dict) for r in rows)):
+        return jsonify({"status": "error", "message": "rows must be an object or a list of objects"}), 400
+
+    predict = (tabular_models.predict_yield if model_name == tabular_models.YIELD_MODEL
+               else tabular_models.predict_irrigation)
+    try:
+        preds = predict(rows)
+    except tabular_models.FeatureValueError as e:
+        return jsonify({"status": "error", "message": str(e), "field": e.field, "row": e.row}), 400
+    except ModelUnavailableError as e:
+        return jsonify({"status": "error", "message": str(e)}), 503
+    return jsonify({"model": model_name, "features": tabular_models.MODEL_FEATURES[model_name],
+                    "predictions": preds})
+
+@api_blueprint.route("/models/metrics", methods=["GET"])
+def tabular_model_metrics():
+    """Report per-model prediction latency for the yield and irrigation models."""
+    return jsonify(tabular_models.stats())
+
+@api_blueprint.route("/crop-health/metrics", methods=["GET"])
+def crop_health_metrics():
+    """Report micro-batching histograms and prediction cache hit rates."""
+    return jsonify({"batcher": crop_health_batcher.stats(), "cache": crop_health_cache.stats()})
+
+@api_blueprint.route("/models/warm-up", methods=["POST"])
+def warm_up_models():
+    """Load all registered models ahead of the first inference request."""
+    errors = registry.warm_up()
+    status = 200 if not any(errors.values()) else 503
+    return jsonify({"status": "ok" if status == 200 else "error", "errors": errors, "models": registry.stats()}), status
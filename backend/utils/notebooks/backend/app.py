@@ -5,9 +5,11 @@ Phase 2: Advisory Engine + Dashboard Integration
 """
 
 import os
+from datetime import datetime
 from flask import Flask, jsonify
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
+from backend.utils.pagination import PaginationError, keyset_list
 
 # ---------- CONFIG ----------
 class Config:
@@ -28,6 +30,10 @@ def init_db(app):
 # ---------- MODELS ----------
 class FarmProfile(db.Model):
     __tablename__ = "farm_profiles"
+    __table_args__ = (
+        db.Index("idx_farm_profiles_crop_type", "crop_type"),
+        db.Index("idx_farm_profiles_region", "region"),
+    )
     id = db.Column(db.Integer, primary_key=True)
     farmer_name = db.Column(db.String(128), nullable=False)
     crop_type = db.Column(db.String(64), nullable=False)
@@ -35,6 +41,9 @@ class FarmProfile(db.Model):
     planting_date = db.Column(db.String(32), nullable=False)
     soil_type = db.Column(db.String(64))
     region = db.Column(db.String(128))
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow,
+                           server_default=db.func.current_timestamp())
 
     def to_dict(self):
         return {
@@ -49,10 +58,15 @@ class FarmProfile(db.Model):
 
 class AdvisoryLog(db.Model):
     __tablename__ = "advisory_logs"
+    __table_args__ = (db.Index("idx_advisory_logs_farm_created", "farm_id", "created_at"),)
     id = db.Column(db.Integer, primary_key=True)
     farm_id = db.Column(db.Integer, db.ForeignKey("farm_profiles.id"), nullable=False)
     advisory_type = db.Column(db.String(64), nullable=False)
     message = db.Column(db.Text, nullable=False)
+    file_name = db.Column(db.String(255))
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+PROFILE_FIELDS = ("id", "farmer_name", "crop_type", "acreage", "planting_date", "soil_type", "region")
 
 # ---------- APP FACTORY ----------
 def create_app():
@@ -66,11 +80,16 @@ def create_app():
     def health_check():
         return jsonify({"status": "ok", "message": "AgriAssist backend running"})
 
-    # Example route: list farm profiles
+    # Example route: list farm profiles (keyset paginated, filterable)
     @app.route("/api/farm-profiles", methods=["GET"])
     def list_profiles():
-        profiles = FarmProfile.query.all()
-        return jsonify([p.to_dict() for p in profiles])
+        from flask import request
+        try:
+            profiles, next_cursor = keyset_list(db.session, FarmProfile, request.args, ("crop_type", "region"),
+                                                   fields=PROFILE_FIELDS)
+        except PaginationError as e:
+            return jsonify({"status": "error", "message": str(e)}), 400
+        return jsonify({"profiles": profiles, "next_cursor": next_cursor})
 
     # Example route: add farm profile
     @app.route("/api/farm-profiles", methods=["POST"])
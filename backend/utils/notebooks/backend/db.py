@@ -6,6 +6,7 @@ Phase 2: Advisory Engine + Dashboard Integration
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.exc import SQLAlchemyError
 import logging
+from backend.utils.serialization import serializer_for
 
 # ---------- INIT ----------
 db = SQLAlchemy()
@@ -23,6 +24,18 @@ def init_db(app):
         except SQLAlchemyError as e:
             logging.error(f"Database initialization failed: {e}")
 
+def create_cli_app():
+    """
+    Minimal Flask app bound to this db, for CLI jobs that run outside the API.
+    """
+    from flask import Flask
+    from backend.config import Config
+
+    app = Flask("agriassist-cli")
+    app.config.from_object(Config)
+    init_db(app)
+    return app
+
 # ---------- SESSION HELPERS ----------
 def commit_session():
     """
@@ -60,12 +73,33 @@ def delete_instance(instance):
         logging.error(f"Failed to delete instance: {e}")
         raise
 
+def bulk_insert(model, rows, before_commit=None):
+    """
+    Insert many rows (list of column dicts) in one executemany and commit once.
+    `before_commit(rows)` runs in the same transaction, e.g. to bump versions.
+    """
+    if not rows:
+        return 0
+    try:
+        db.session.bulk_insert_mappings(model, rows)
+        if before_commit is not None:
+            before_commit(rows)
+        commit_session()
+        logging.info(f"Bulk inserted {len(rows)} {model.__name__} rows.")
+        return len(rows)
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        logging.error(f"Bulk insert of {model.__name__} failed: {e}")
+        raise
+
 # ---------- BASE MODEL ----------
 class BaseModel(db.Model):
     """
     Base model with common methods for all tables.
     """
     __abstract__ = True
+    # Columns to_dict returns, in order (None = every table column)
+    SERIALIZED_FIELDS = None
 
     def save(self):
         """
@@ -81,6 +115,7 @@ class BaseModel(db.Model):
 
     def to_dict(self):
         """
-        Convert model instance to dictionary.
+        Convert model instance to dictionary of SERIALIZED_FIELDS (column
+        accessors compiled once per model).
         """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        return serializer_for(type(self), self.SERIALIZED_FIELDS)(self)
@@ -5,6 +5,7 @@ Phase 2: Advisory Engine + Dashboard Integration
 
 from backend.models.farm_profile import FarmProfile
 from backend.models.advisory_log import AdvisoryLog
+from backend.models.versioning import touch_farms
 
 # Expose models for easy import
-__all__ = ["FarmProfile", "AdvisoryLog"]
+__all__ = ["FarmProfile", "AdvisoryLog", "touch_farms"]
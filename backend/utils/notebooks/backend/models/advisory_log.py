@@ -3,26 +3,30 @@ AgriAssist AI - Advisory Log Model
 Phase 2: Advisory Engine + Dashboard Integration
 """
 
+from datetime import datetime
 from backend.db import db, BaseModel
 
 class AdvisoryLog(BaseModel):
     __tablename__ = "advisory_logs"
+    # Match database/schema.sql; serves the newest-first per-farm feed
+    __table_args__ = (
+        db.Index("idx_advisory_logs_farm_created", "farm_id", "created_at"),
+    )
+
+    SERIALIZED_FIELDS = ("id", "farm_id", "advisory_type", "message", "file_name", "created_at")
 
     id = db.Column(db.Integer, primary_key=True)
     farm_id = db.Column(db.Integer, db.ForeignKey("farm_profiles.id"), nullable=False)
     advisory_type = db.Column(db.String(64), nullable=False)   # e.g., irrigation, fertilizer, market, crop_health
     message = db.Column(db.Text, nullable=False)
+    # Stored upload name on crop_health rows recorded by an image upload
+    file_name = db.Column(db.String(255))
+    # Python default only: SQLite's CURRENT_TIMESTAMP drops microseconds and
+    # would not compare with the bound feed cursor (see database/migrate.py)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
     # Relationship back to FarmProfile
     farm_profile = db.relationship("FarmProfile", backref=db.backref("advisories", lazy=True))
 
     def __repr__(self):
         return f"<AdvisoryLog {self.id} - Farm {self.farm_id}, Type {self.advisory_type}>"
-
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "farm_id": self.farm_id,
-            "advisory_type": self.advisory_type,
-            "message": self.message,
-        }
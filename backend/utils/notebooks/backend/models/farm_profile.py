@@ -3,10 +3,18 @@ AgriAssist AI - Farm Profile Model
 Phase 2: Advisory Engine + Dashboard Integration
 """
 
+from datetime import datetime
 from backend.db import db, BaseModel
 
 class FarmProfile(BaseModel):
     __tablename__ = "farm_profiles"
+    # Match database/schema.sql; list filters on crop_type/region use these
+    __table_args__ = (
+        db.Index("idx_farm_profiles_crop_type", "crop_type"),
+        db.Index("idx_farm_profiles_region", "region"),
+    )
+
+    SERIALIZED_FIELDS = ("id", "farmer_name", "crop_type", "acreage", "planting_date", "soil_type", "region")
 
     id = db.Column(db.Integer, primary_key=True)
     farmer_name = db.Column(db.String(128), nullable=False)
@@ -15,17 +23,10 @@ class FarmProfile(BaseModel):
     planting_date = db.Column(db.String(32), nullable=False)
     soil_type = db.Column(db.String(64))
     region = db.Column(db.String(128))
+    # Bumped on any change to the profile or its advisories (see models.versioning)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow,
+                           server_default=db.func.current_timestamp())
 
     def __repr__(self):
         return f"<FarmProfile {self.id} - {self.farmer_name}, {self.crop_type}>"
-
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "farmer_name": self.farmer_name,
-            "crop_type": self.crop_type,
-            "acreage": self.acreage,
-            "planting_date": self.planting_date,
-            "soil_type": self.soil_type,
-            "region": self.region,
-        }
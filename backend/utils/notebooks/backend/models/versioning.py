@@ -0,0 +1,77 @@
+"""
+AgriAssist AI - Farm Version Tracking
+Phase 2: Advisory Engine + Dashboard Integration
+
+Each FarmProfile row carries a version counter and updated_at timestamp that
+change whenever the profile or any of its advisory logs changes. The API
+uses them as ETag / Last-Modified validators, so an unchanged farm is
+answered with 304 after a single primary-key lookup.
+
+ORM changes are tracked by session flush hooks. Bulk inserts bypass the
+ORM unit of work, so callers that use them must call touch_farms.
+"""
+
+from datetime import datetime
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+from backend.models.farm_profile import FarmProfile
+from backend.models.advisory_log import AdvisoryLog
+
+_PENDING_KEY = "changed_farm_ids"
+
+def _farm_ids(farm_ids):
+    """Distinct integer farm ids (request values may arrive as strings)."""
+    ids = set()
+    for fid in farm_ids:
+        try:
+            ids.add(int(fid))
+        except (TypeError, ValueError):
+            continue
+    return sorted(ids)
+
+def touch_farms(farm_ids, session=None):
+    """
+    Bump version/updated_at of the given farms in the current transaction
+    (one atomic UPDATE; the caller commits). Loaded FarmProfile instances
+    are expired so the new values are read back on next access.
+    """
+    farm_ids = _farm_ids(farm_ids)
+    if not farm_ids:
+        return
+    if session is None:
+        from backend.db import db
+        session = db.session
+    table = FarmProfile.__table__
+    session.connection().execute(
+        table.update()
+        .where(table.c.id.in_(farm_ids))
+        .values(version=table.c.version + 1, updated_at=datetime.utcnow())
+    )
+    for fid in farm_ids:
+        farm = session.identity_map.get(identity_key(FarmProfile, fid))
+        if farm is not None:
+            session.expire(farm, ["version", "updated_at"])
+
+@event.listens_for(Session, "before_flush")
+def _collect_changed_farms(session, flush_context, instances):
+    pending = session.info.setdefault(_PENDING_KEY, set())
+    for obj in session.new:
+        if isinstance(obj, AdvisoryLog):
+            pending.add(obj.farm_id)
+    for obj in session.dirty:
+        if isinstance(obj, FarmProfile) and session.is_modified(obj):
+            # Compiled into the profile's own UPDATE: version = version + 1
+            obj.version = FarmProfile.version + 1
+            obj.updated_at = datetime.utcnow()
+        elif isinstance(obj, AdvisoryLog) and session.is_modified(obj):
+            pending.add(obj.farm_id)
+    for obj in session.deleted:
+        if isinstance(obj, AdvisoryLog):
+            pending.add(obj.farm_id)
+
+@event.listens_for(Session, "after_flush")
+def _bump_changed_farms(session, flush_context):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        touch_farms(pending, session)
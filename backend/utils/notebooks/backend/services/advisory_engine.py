@@ -4,11 +4,15 @@ Phase 2: Advisory Engine + Dashboard Integration
 
 This module generates advisories for farms based on weather, soil, yield, market,
 and crop health data. It stores advisories in the database for dashboard display.
+
+Weather and soil thresholds live in the rule_engine table. The generate_*
+functions only produce messages; persistence happens in one step
+(`save_advisories`), a single bulk insert per evaluation or farm batch.
 """
 
-import datetime
-from backend.db import db
-from backend.models import FarmProfile, AdvisoryLog
+from backend.db import bulk_insert
+from backend.models import FarmProfile, AdvisoryLog, touch_farms
+from backend.services.rule_engine import evaluate_record
 
 # ---------- WEATHER ADVISORY ----------
 def generate_weather_advisory(farm: FarmProfile, weather_data: dict):
@@ -16,24 +20,7 @@ def generate_weather_advisory(farm: FarmProfile, weather_data: dict):
     Generate irrigation/fertilizer advisories based on weather data.
     Example weather_data: {"temperature": 32, "rainfall": 5, "humidity": 70}
     """
-    advisories = []
-
-    if weather_data.get("rainfall", 0) < 10:
-        advisories.append("Low rainfall detected. Consider irrigation scheduling.")
-    if weather_data.get("temperature", 0) > 35:
-        advisories.append("High temperature stress. Mulching recommended to retain soil moisture.")
-    if weather_data.get("humidity", 0) > 80:
-        advisories.append("High humidity may increase fungal risk. Monitor crop health closely.")
-
-    for msg in advisories:
-        log = AdvisoryLog(
-            farm_id=farm.id,
-            advisory_type="weather",
-            message=msg
-        )
-        db.session.add(log)
-    db.session.commit()
-    return advisories
+    return evaluate_record("weather", weather_data)
 
 # ---------- SOIL ADVISORY ----------
 def generate_soil_advisory(farm: FarmProfile, soil_data: dict):
@@ -41,22 +28,7 @@ def generate_soil_advisory(farm: FarmProfile, soil_data: dict):
     Generate fertilizer advisories based on soil nutrient levels.
     Example soil_data: {"nitrogen": 20, "ph": 5.5}
     """
-    advisories = []
-
-    if soil_data.get("nitrogen", 0) < 30:
-        advisories.append("Nitrogen deficiency detected. Apply nitrogen-rich fertilizer.")
-    if soil_data.get("ph", 7) < 6:
-        advisories.append("Soil is acidic. Consider liming to balance pH.")
-
-    for msg in advisories:
-        log = AdvisoryLog(
-            farm_id=farm.id,
-            advisory_type="soil",
-            message=msg
-        )
-        db.session.add(log)
-    db.session.commit()
-    return advisories
+    return evaluate_record("soil", soil_data)
 
 # ---------- YIELD ADVISORY ----------
 def generate_yield_forecast(farm: FarmProfile, yield_model_output: float):
@@ -65,13 +37,6 @@ def generate_yield_forecast(farm: FarmProfile, yield_model_output: float):
     yield_model_output: predicted yield value (e.g., tons per hectare).
     """
     msg = f"Predicted yield for {farm.crop_type}: {yield_model_output:.2f} tons/hectare."
-    log = AdvisoryLog(
-        farm_id=farm.id,
-        advisory_type="yield",
-        message=msg
-    )
-    db.session.add(log)
-    db.session.commit()
     return [msg]
 
 # ---------- MARKET ADVISORY ----------
@@ -91,14 +56,6 @@ def generate_market_insight(farm: FarmProfile, market_data: dict):
     elif trend == "falling":
         advisories.append(f"Consider early sale of {crop} before prices drop further.")
 
-    for msg in advisories:
-        log = AdvisoryLog(
-            farm_id=farm.id,
-            advisory_type="market",
-            message=msg
-        )
-        db.session.add(log)
-    db.session.commit()
     return advisories
 
 # ---------- CROP HEALTH ADVISORY ----------
@@ -116,26 +73,34 @@ def generate_crop_health_advisory(farm: FarmProfile, health_status: str):
     elif health_status.lower() == "leaf blight":
         advisories.append("Leaf blight detected. Remove infected leaves and apply fungicide.")
 
-    for msg in advisories:
-        log = AdvisoryLog(
-            farm_id=farm.id,
-            advisory_type="crop_health",
-            message=msg
-        )
-        db.session.add(log)
-    db.session.commit()
     return advisories
 
-# ---------- MASTER FUNCTION ----------
-def generate_all_advisories(farm_id: int, weather_data=None, soil_data=None,
-                            yield_model_output=None, market_data=None, health_status=None):
+# ---------- PERSISTENCE ----------
+def advisory_rows(farm_id: int, results: dict):
     """
-    Generate all advisories for a given farm in one call.
+    Flatten {advisory_type: [messages]} into AdvisoryLog column dicts.
     """
-    farm = FarmProfile.query.get(farm_id)
-    if not farm:
-        return {"error": "Farm profile not found"}
+    return [
+        {"farm_id": farm_id, "advisory_type": advisory_type, "message": msg}
+        for advisory_type, messages in results.items()
+        for msg in messages
+    ]
+
+def save_advisories(rows):
+    """
+    Write advisory rows (from one or many farms) in a single bulk insert and
+    bump the affected farms' versions in the same transaction.
+    Returns the number of rows written.
+    """
+    return bulk_insert(AdvisoryLog, rows,
+                       before_commit=lambda rows: touch_farms(row["farm_id"] for row in rows))
 
+# ---------- MASTER FUNCTION ----------
+def evaluate_advisories(farm: FarmProfile, weather_data=None, soil_data=None,
+                        yield_model_output=None, market_data=None, health_status=None):
+    """
+    Run every applicable rule for a loaded farm without touching the database.
+    """
     results = {}
     if weather_data:
         results["weather"] = generate_weather_advisory(farm, weather_data)
@@ -147,5 +112,21 @@ def generate_all_advisories(farm_id: int, weather_data=None, soil_data=None,
         results["market"] = generate_market_insight(farm, market_data)
     if health_status:
         results["crop_health"] = generate_crop_health_advisory(farm, health_status)
+    return results
+
+def generate_all_advisories(farm_id: int, weather_data=None, soil_data=None,
+                            yield_model_output=None, market_data=None, health_status=None,
+                            persist=True):
+    """
+    Generate all advisories for a given farm in one call.
+    With persist=False the advisories are only returned (preview mode).
+    """
+    farm = FarmProfile.query.get(farm_id)
+    if not farm:
+        return {"error": "Farm profile not found"}
 
+    results = evaluate_advisories(farm, weather_data, soil_data,
+                                  yield_model_output, market_data, health_status)
+    if persist:
+        save_advisories(advisory_rows(farm.id, results))
     return results
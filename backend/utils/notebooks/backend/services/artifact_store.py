@@ -0,0 +1,120 @@
+"""
+AgriAssist AI - Model Artifact Store
+Phase 2: Advisory Engine + Dashboard Integration
+
+Saves and loads the scikit-learn artifacts in models_store. Artifacts are
+written with joblib (uncompressed) and loaded with mmap_mode, so their NumPy
+weight arrays are memory-mapped from the file and shared through the page
+cache by every forked worker instead of being copied into each process.
+
+Unpickling runs arbitrary code, so every artifact has a <file>.sha256 sidecar
+and is only loaded when its content matches that digest.
+
+Sign existing artifacts (run from the backend parent folder):
+    python -m backend.services.artifact_store sign models_store/yield_model.pkl
+"""
+
+import os
+import pickle
+import hashlib
+import logging
+import argparse
+
+try:
+    import joblib
+except ImportError:  # joblib ships with scikit-learn; plain pickle as a fallback
+    joblib = None
+
+# "r" maps arrays read-only; "" loads them into process memory
+MMAP_MODE = os.getenv("MODEL_MMAP_MODE", "r") or None
+VERIFY_ARTIFACTS = os.getenv("VERIFY_ARTIFACTS", "True").lower() in ("true", "1", "yes")
+
+# ---------- ERRORS ----------
+class ArtifactIntegrityError(RuntimeError):
+    """Raised when an artifact has no stored digest or does not match it."""
+
+# ---------- DIGESTS ----------
+def digest_path(path):
+    return f"{path}.sha256"
+
+def file_digest(path):
+    """sha256 of the file contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def write_digest(path):
+    """Record the artifact's current digest in its sidecar file."""
+    value = file_digest(path)
+    with open(digest_path(path), "w") as f:
+        f.write(f"{value}  {os.path.basename(path)}\n")
+    return value
+
+def read_digest(path):
+    """Stored digest for `path`, or None if the sidecar is missing."""
+    try:
+        with open(digest_path(path)) as f:
+            return f.read().split()[0]
+    except (OSError, IndexError):
+        return None
+
+def verify_artifact(path):
+    """Raise ArtifactIntegrityError unless `path` matches its stored digest."""
+    expected = read_digest(path)
+    if expected is None:
+        raise ArtifactIntegrityError(f"No stored digest for {path} ({digest_path(path)} missing)")
+    actual = file_digest(path)
+    if actual != expected:
+        raise ArtifactIntegrityError(f"Digest mismatch for {path}: expected {expected}, got {actual}")
+
+# ---------- LOAD / SAVE ----------
+def load_artifact(path, mmap_mode=MMAP_MODE, verify=VERIFY_ARTIFACTS):
+    """
+    Verify and load an artifact. With joblib and an mmap_mode, NumPy arrays
+    stored uncompressed are memory-mapped rather than read into memory.
+    """
+    if verify:
+        verify_artifact(path)
+    if joblib is None:
+        logging.warning(f"joblib not installed; loading {path} without memory mapping")
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    return joblib.load(path, mmap_mode=mmap_mode)
+
+def save_artifact(obj, path):
+    """
+    Write `obj` uncompressed (compressed arrays cannot be memory-mapped)
+    and record its digest. Returns the digest.
+    """
+    if joblib is None:
+        with open(path, "wb") as f:
+            pickle.dump(obj, f)
+    else:
+        joblib.dump(obj, path)
+    return write_digest(path)
+
+# ---------- CLI ----------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sign or verify model artifacts.")
+    parser.add_argument("action", choices=["sign", "verify"])
+    parser.add_argument("paths", nargs="+")
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for path in args.paths:
+        if args.action == "sign":
+            logging.info(f"{path}: {write_digest(path)}")
+            continue
+        try:
+            verify_artifact(path)
+            logging.info(f"{path}: ok")
+        except (ArtifactIntegrityError, OSError) as e:
+            logging.error(str(e))
+            failed += 1
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    raise SystemExit(main())
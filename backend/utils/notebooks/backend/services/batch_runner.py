@@ -0,0 +1,237 @@
+"""
+AgriAssist AI - Batch Advisory Runner
+Phase 2: Advisory Engine + Dashboard Integration
+
+Runs the advisory engine and resource optimizer for every registered farm.
+Farms are streamed in keyset-paginated chunks (id > last_id), the rules are
+evaluated for the whole chunk, and each chunk's advisories are written in one
+bulk insert. Progress is checkpointed so an interrupted run can resume.
+With --use-models, the yield and irrigation models score each chunk in one
+predict call per model and feed the yield forecast and irrigation advisories.
+
+Usage (from the backend parent folder):
+    python -m backend.services.batch_runner --readings readings.json --resume
+"""
+
+import os
+import json
+import time
+import logging
+import argparse
+from backend.db import db, create_cli_app
+from backend.models import FarmProfile
+from backend.services.advisory_engine import evaluate_advisories, advisory_rows, save_advisories
+from backend.services.market_insight import index as market_index
+from backend.services.resource_optimizer import irrigation_model_advisory
+from backend.services.rule_engine import readings_frame, frame_advisories
+from backend.services.model_registry import ModelUnavailableError
+from backend.services import tabular_models
+from backend.utils.file_paths import MARKET_DATA_FILE
+
+DEFAULT_CHUNK_SIZE = int(os.getenv("BATCH_CHUNK_SIZE", 500))
+DEFAULT_CHECKPOINT = os.getenv("BATCH_CHECKPOINT", "batch_runner.checkpoint.json")
+
+# ---------- FARM STREAM ----------
+def iter_farm_chunks(chunk_size=DEFAULT_CHUNK_SIZE, after_id=0):
+    """
+    Yield lists of FarmProfile rows ordered by id, `chunk_size` at a time.
+    Uses keyset pagination so every chunk is an index range scan.
+    """
+    last_id = after_id or 0
+    while True:
+        farms = (FarmProfile.query
+                 .filter(FarmProfile.id > last_id)
+                 .order_by(FarmProfile.id)
+                 .limit(chunk_size)
+                 .all())
+        if not farms:
+            return
+        yield farms
+        last_id = farms[-1].id
+
+# ---------- INPUTS ----------
+def load_readings(path):
+    """
+    Load per-farm inputs from JSON:
+    {"default": {...}, "regions": {"Haryana": {...}}, "farms": {"12": {...}}}
+    Each entry may hold weather_data, soil_data, yield_model_output,
+    market_data and health_status. Farm entries override region entries,
+    which override the default.
+    """
+    if not path:
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def resolve_inputs(farm, readings):
+    """Merge default, region and farm-level inputs for one farm."""
+    inputs = dict(readings.get("default", {}))
+    inputs.update(readings.get("regions", {}).get(farm.region or "", {}))
+    inputs.update(readings.get("farms", {}).get(str(farm.id), {}))
+    return inputs
+
+class _MarketLookup:
+    """Market insight by crop from the shared market index."""
+
+    def __init__(self, csv_path):
+        self.csv_path = csv_path
+
+    def get(self, crop):
+        if not self.csv_path:
+            return None
+        try:
+            insight = market_index.get(crop, self.csv_path)
+        except (OSError, KeyError) as e:
+            logging.warning(f"Market data unavailable: {e}")
+            self.csv_path = None
+            return None
+        return {"crop": crop, **insight} if insight else None
+
+# ---------- CHECKPOINT ----------
+def read_checkpoint(path):
+    """Return the last processed farm id recorded at `path` (0 if none)."""
+    try:
+        with open(path) as f:
+            return int(json.load(f).get("last_farm_id", 0))
+    except (OSError, ValueError):
+        return 0
+
+def write_checkpoint(path, last_farm_id):
+    """Atomically record the last processed farm id."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"last_farm_id": last_farm_id, "updated_at": time.time()}, f)
+    os.replace(tmp_path, path)
+
+# ---------- RUNNER ----------
+# Threshold rules evaluated over the whole chunk, keyed by the input they read
+VECTORIZED_RULES = (("weather_data", ("weather", "irrigation")),
+                    ("soil_data", ("soil", "fertilizer")))
+# Row order per farm, matching generate_all_advisories then optimize_resources
+ADVISORY_ORDER = ("weather", "soil", "yield", "market", "crop_health", "irrigation", "fertilizer")
+
+def _model_outputs(farms, inputs):
+    """Yield and irrigation predictions for the chunk, or None if the models are unavailable."""
+    try:
+        return tabular_models.forecast_farms(
+            farms,
+            [inp.get("weather_data") for inp in inputs],
+            [inp.get("soil_data") for inp in inputs],
+        )
+    except ModelUnavailableError as e:
+        logging.warning(f"Tabular models unavailable, skipping model advisories: {e}")
+        return None
+
+def evaluate_chunk(farms, readings, market=None, use_models=False):
+    """
+    Evaluate advisories and resource recommendations for a chunk of farms.
+    Weather/soil/irrigation/fertilizer thresholds are applied to the whole
+    chunk in one vectorized pass. Returns the AdvisoryLog rows for the chunk.
+    """
+    inputs = [resolve_inputs(farm, readings) for farm in farms]
+    if market is not None:
+        for farm, inp in zip(farms, inputs):
+            if "market_data" not in inp:
+                inp["market_data"] = market.get(farm.crop_type)
+
+    irrigation = [None] * len(farms)
+    outputs = _model_outputs(farms, inputs) if use_models else None
+    if outputs is not None:
+        yields, irrigation = outputs
+        for inp, predicted in zip(inputs, yields):
+            if inp.get("yield_model_output") is None:
+                inp["yield_model_output"] = predicted
+
+    results = [{} for _ in farms]
+    for source, advisory_types in VECTORIZED_RULES:
+        idx = [i for i, inp in enumerate(inputs) if inp.get(source)]
+        if not idx:
+            continue
+        frame = readings_frame([inputs[i][source] for i in idx], [farms[i].crop_type for i in idx])
+        for advisory_type in advisory_types:
+            for k, messages in enumerate(frame_advisories(advisory_type, frame)):
+                results[idx[k]][advisory_type] = messages
+
+    rows = []
+    for farm, inp, result, needed in zip(farms, inputs, results, irrigation):
+        if "irrigation" in result:
+            result["irrigation"] += irrigation_model_advisory(needed)
+        result.update(evaluate_advisories(
+            farm,
+            yield_model_output=inp.get("yield_model_output"),
+            market_data=inp.get("market_data"),
+            health_status=inp.get("health_status"),
+        ))
+        ordered = {t: result[t] for t in ADVISORY_ORDER if t in result}
+        rows.extend(advisory_rows(farm.id, ordered))
+    return rows
+
+def run_batch(readings=None, chunk_size=DEFAULT_CHUNK_SIZE, after_id=0,
+              market_csv=MARKET_DATA_FILE, persist=True, checkpoint_path=None, use_models=False):
+    """
+    Evaluate every farm with id > after_id. Must run inside an app context.
+    Returns a summary with farm/advisory counts, elapsed time and farms/sec.
+    """
+    readings = readings or {}
+    market = _MarketLookup(market_csv)
+    farms_done = 0
+    advisories = 0
+    last_id = after_id
+    start = time.perf_counter()
+
+    for farms in iter_farm_chunks(chunk_size, after_id):
+        rows = evaluate_chunk(farms, readings, market, use_models)
+        if persist:
+            save_advisories(rows)
+        farms_done += len(farms)
+        advisories += len(rows)
+        last_id = farms[-1].id
+        if checkpoint_path and persist:
+            write_checkpoint(checkpoint_path, last_id)
+        # Drop processed rows from the identity map to keep memory flat
+        db.session.expunge_all()
+
+        elapsed = time.perf_counter() - start
+        logging.info(f"Processed {farms_done} farms up to id {last_id} "
+                     f"({farms_done / elapsed:.1f} farms/sec)")
+
+    elapsed = time.perf_counter() - start
+    return {
+        "farms": farms_done,
+        "advisories": advisories,
+        "seconds": round(elapsed, 3),
+        "farms_per_sec": round(farms_done / elapsed, 1) if elapsed > 0 else 0.0,
+        "last_farm_id": last_id,
+    }
+
+# ---------- CLI ----------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run advisories for all registered farms.")
+    parser.add_argument("--readings", help="JSON file of default/region/farm inputs")
+    parser.add_argument("--market-csv", default=MARKET_DATA_FILE, help="Market prices CSV ('' to skip)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--after-id", type=int, default=0, help="Start after this farm id")
+    parser.add_argument("--resume", action="store_true", help="Start after the checkpointed farm id")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT)
+    parser.add_argument("--dry-run", action="store_true", help="Evaluate without writing advisories")
+    parser.add_argument("--use-models", action="store_true", help="Score yield/irrigation with the shipped models")
+    args = parser.parse_args(argv)
+
+    after_id = read_checkpoint(args.checkpoint) if args.resume else args.after_id
+    app = create_cli_app()
+    with app.app_context():
+        summary = run_batch(
+            readings=load_readings(args.readings),
+            chunk_size=args.chunk_size,
+            after_id=after_id,
+            market_csv=args.market_csv,
+            persist=not args.dry_run,
+            checkpoint_path=args.checkpoint,
+            use_models=args.use_models,
+        )
+    logging.info(f"Batch run complete: {summary}")
+    return 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    raise SystemExit(main())
@@ -4,16 +4,68 @@ Phase 2: Advisory Engine + Dashboard Integration
 
 This module loads a trained CNN model and performs crop health classification
 on uploaded images. Results are passed to advisory_engine for recommendations.
+
+The model is loaded lazily through the shared model registry, so TensorFlow is
+only imported when the first inference (or warm-up) actually needs it.
+CROP_HEALTH_BACKEND selects the runtime: "keras" (default), "tflite" or "onnx";
+point CROP_HEALTH_MODEL at the matching artifact.
 """
 
+import io
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from tensorflow.keras.models import load_model
-from tensorflow.keras.preprocessing import image
+from backend.services import image_pipeline
+from backend.services.model_registry import registry
+from backend.services.inference_backends import load_backend
+from backend.services.inference_batcher import MicroBatcher
+from backend.services.prediction_cache import PredictionCache, content_key
 
 # ---------- MODEL LOADING ----------
+MODEL_NAME = "crop_health_cnn"
 MODEL_PATH = os.getenv("CROP_HEALTH_MODEL", "models_store/crop_health_cnn.h5")
-model = load_model(MODEL_PATH)
+BACKEND = os.getenv("CROP_HEALTH_BACKEND", "keras").lower()
+
+def _load_backend(path):
+    return load_backend(BACKEND, path)
+
+registry.register(MODEL_NAME, MODEL_PATH, _load_backend)
+
+def get_model():
+    """
+    Return the shared crop health model, loading it on first use.
+    Raises ModelUnavailableError if the model file is missing or invalid.
+    """
+    return registry.get(MODEL_NAME)
+
+def warm_up():
+    """
+    Load the crop health model ahead of the first request.
+    Returns None on success, or the error message.
+    """
+    return registry.warm_up(MODEL_NAME)[MODEL_NAME]
+
+# ---------- MICRO-BATCHING ----------
+# Concurrent /crop-health/infer requests are merged into one model.predict call.
+MAX_BATCH_SIZE = int(os.getenv("CROP_HEALTH_MAX_BATCH_SIZE", 16))
+MAX_WAIT_MS = float(os.getenv("CROP_HEALTH_MAX_WAIT_MS", 10))
+
+def _predict_array(batch):
+    return get_model().predict(batch)
+
+batcher = MicroBatcher(_predict_array, max_batch_size=MAX_BATCH_SIZE,
+                       max_wait_ms=MAX_WAIT_MS, name="crop-health")
+
+# ---------- RESULT CACHE ----------
+# Re-uploads of the same photo are answered without touching the model.
+CACHE_SIZE = int(os.getenv("CROP_HEALTH_CACHE_SIZE", 1024))
+CACHE_PATH = os.getenv("CROP_HEALTH_CACHE_PATH", "")
+
+cache = PredictionCache(max_entries=CACHE_SIZE, persist_path=CACHE_PATH)
+
+# ---------- BULK INFERENCE ----------
+BULK_BATCH_SIZE = int(os.getenv("CROP_HEALTH_BULK_BATCH_SIZE", 32))
 
 # Class labels (adjust based on your dataset)
 CLASS_LABELS = ["Healthy", "Rust", "Leaf Blight"]
@@ -21,19 +73,78 @@ CLASS_LABELS = ["Healthy", "Rust", "Leaf Blight"]
 def preprocess_image(img_path, target_size=(224, 224)):
     """
     Load and preprocess image for CNN inference.
+    Returns a float32 array of shape (1, H, W, 3) scaled to 0-1.
     """
-    img = image.load_img(img_path, target_size=target_size)
-    img_array = image.img_to_array(img)
-    img_array = np.expand_dims(img_array, axis=0)
-    img_array /= 255.0
-    return img_array
+    out = image_pipeline.allocate_batch(1, target_size)
+    image_pipeline.write_normalized(image_pipeline.load_rgb(img_path, target_size), out[0])
+    return out
 
 def predict_crop_health(img_path):
     """
     Predict crop health status using CNN model.
+    Results are cached by image content and model version.
+    """
+    with open(img_path, "rb") as f:
+        data = f.read()
+    return predict_crop_health_bytes(data)
+
+def predict_crop_health_bytes(data: bytes):
+    """
+    Predict crop health status for an encoded image held in memory.
+    """
+    key = content_key(data, registry.version(MODEL_NAME))
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    get_model()
+    start = time.perf_counter()
+    processed = preprocess_image(io.BytesIO(data))
+    if MAX_BATCH_SIZE > 1:
+        preds = batcher.predict(processed)
+    else:
+        preds = _predict_array(processed)
+    result = format_prediction(preds[0])
+    cache.put(key, result, time.perf_counter() - start)
+    return result
+
+def format_prediction(probs):
     """
-    processed = preprocess_image(img_path)
-    preds = model.predict(processed)
-    class_idx = np.argmax(preds, axis=1)[0]
-    confidence = float(np.max(preds))
+    Convert one row of class probabilities into a status/confidence dict.
+    """
+    class_idx = int(np.argmax(probs))
+    confidence = float(probs[class_idx])
     return {"status": CLASS_LABELS[class_idx], "confidence": confidence}
+
+def predict_crop_health_batch(img_paths, batch_size=None):
+    """
+    Predict crop health for many images in fixed-size batches.
+    Images are decoded on the preprocessing thread pool into two reusable
+    batch buffers, so the next batch is decoded while the current one runs
+    through the model. Yields one list of (img_path, result) pairs per batch;
+    unreadable images get {"error": ...}.
+    """
+    batch_size = max(int(batch_size or BULK_BATCH_SIZE), 1)
+    img_paths = list(img_paths)
+    if not img_paths:
+        return
+    get_model()
+
+    chunks = [img_paths[i:i + batch_size] for i in range(0, len(img_paths), batch_size)]
+    buffers = [image_pipeline.allocate_batch(min(batch_size, len(img_paths)))
+               for _ in range(min(2, len(chunks)))]
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="img-prefetch") as prefetch:
+        pending = prefetch.submit(image_pipeline.fill_batch, chunks[0], buffers[0])
+        for idx, chunk in enumerate(chunks):
+            buf = buffers[idx % len(buffers)]
+            ok = pending.result()
+            if idx + 1 < len(chunks):
+                pending = prefetch.submit(image_pipeline.fill_batch, chunks[idx + 1],
+                                          buffers[(idx + 1) % len(buffers)])
+
+            results = [{"error": "Image could not be decoded."}] * len(chunk)
+            if any(ok):
+                preds = _predict_array(image_pipeline.valid_rows(buf, ok))
+                for row, i in enumerate(np.flatnonzero(ok)):
+                    results[i] = format_prediction(preds[row])
+            yield list(zip(chunk, results))
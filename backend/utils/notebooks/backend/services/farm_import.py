@@ -0,0 +1,229 @@
+"""
+AgriAssist AI - Bulk Farm Profile Import
+Phase 2: Advisory Engine + Dashboard Integration
+
+Registers many farm profiles from a CSV or NDJSON file in one pass. Records
+are streamed and validated in chunks, every valid row of a chunk is written
+with one bulk insert, and invalid rows are reported by row number without
+aborting the rest of the import. A chunk whose insert fails is split and
+retried, so only the rows the database rejects are reported.
+
+Usage (from the backend parent folder):
+    python -m backend.services.farm_import district_farms.csv
+"""
+
+import io
+import os
+import csv
+import json
+import time
+import logging
+import argparse
+from sqlalchemy.exc import SQLAlchemyError
+from backend.db import bulk_insert, create_cli_app
+from backend.models import FarmProfile
+from backend.utils.validators import validate_farm_profiles
+
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", 1000))
+# Cap on per-row errors returned; counts stay exact beyond it
+MAX_REPORTED_ERRORS = int(os.getenv("IMPORT_MAX_REPORTED_ERRORS", 1000))
+IMPORT_FORMATS = ("csv", "ndjson")
+PROFILE_FIELDS = ("farmer_name", "crop_type", "acreage", "planting_date", "soil_type", "region")
+TEXT_FIELDS = ("farmer_name", "crop_type", "planting_date", "soil_type", "region")
+SCALAR_TYPES = (str, int, float)
+
+# ---------- ERRORS ----------
+class ImportFormatError(ValueError):
+    """Raised when the import format is unknown or the file header is unusable."""
+
+# ---------- READING ----------
+def detect_format(filename=None, content_type=None):
+    """Import format from a file name extension or Content-Type."""
+    ext = os.path.splitext(filename or "")[1].lower()
+    if ext == ".csv" or "csv" in (content_type or ""):
+        return "csv"
+    if ext in (".ndjson", ".jsonl") or "ndjson" in (content_type or "") or "jsonl" in (content_type or ""):
+        return "ndjson"
+    raise ImportFormatError("Cannot tell the import format; use a .csv or .ndjson file or pass format.")
+
+def iter_records(text_stream, fmt):
+    """
+    Yield (row_number, record dict or None, parse error or None) from a text
+    stream. Row numbers are 1-based data rows (the CSV header is not counted).
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(text_stream)
+        try:
+            fieldnames = reader.fieldnames
+        except csv.Error as e:
+            raise ImportFormatError(f"Unreadable CSV header: {e}")
+        if not fieldnames or not {"farmer_name", "crop_type"} & set(fieldnames):
+            raise ImportFormatError("CSV header must name farm profile columns (farmer_name, crop_type, ...).")
+        number = 0
+        while True:
+            number += 1
+            try:
+                record = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                # The reader resets per row, so later rows still import
+                yield number, None, f"Malformed CSV row: {e}"
+                continue
+            # Empty cells mean "not given", exactly as a missing JSON key
+            yield number, {k: v for k, v in record.items() if k and v not in ("", None)}, None
+    elif fmt == "ndjson":
+        number = 0
+        for line in text_stream:
+            if not line.strip():
+                continue
+            number += 1
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield number, None, f"Invalid JSON: {e}"
+                continue
+            if not isinstance(record, dict):
+                yield number, None, "Each line must be a JSON object."
+                continue
+            yield number, record, None
+    else:
+        raise ImportFormatError(f"Unknown import format '{fmt}'. Use one of: {', '.join(IMPORT_FORMATS)}.")
+
+# ---------- VALIDATION ----------
+def field_type_errors(record):
+    """Errors for profile fields holding JSON lists/objects/booleans instead of text or numbers."""
+    return [
+        f"Field '{field}' must be text or a number."
+        for field in PROFILE_FIELDS
+        if record.get(field) is not None
+        and (isinstance(record[field], bool) or not isinstance(record[field], SCALAR_TYPES))
+    ]
+
+def validate_chunk(records):
+    """
+    Validate a chunk of records in one vectorized pass. Returns a list of
+    error lists aligned with `records` (empty list = valid). Records with
+    non-scalar profile fields are reported by field instead.
+    """
+    results = validate_farm_profiles(records)
+    for i, record in enumerate(records):
+        type_errors = field_type_errors(record)
+        if type_errors:
+            results[i] = type_errors
+    return results
+
+def profile_row(record):
+    """Column dict for a validated record, coerced as POST /farm-profiles does."""
+    row = {field: record.get(field) for field in PROFILE_FIELDS}
+    row["acreage"] = float(row["acreage"])
+    for field in TEXT_FIELDS:
+        if row[field] is not None:
+            row[field] = str(row[field])
+    return row
+
+# ---------- IMPORT ----------
+def _chunks(records, size):
+    chunk = []
+    for item in records:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _insert(rows, numbers, fail):
+    """
+    Bulk insert `rows`; when the database rejects the batch, bisect it so
+    only the offending rows fail. Returns the number of rows inserted.
+    """
+    try:
+        return bulk_insert(FarmProfile, rows)
+    except SQLAlchemyError as e:
+        if len(rows) == 1:
+            fail(numbers[0], [f"Database insert failed: {e.__class__.__name__}"])
+            return 0
+    half = len(rows) // 2
+    return _insert(rows[:half], numbers[:half], fail) + _insert(rows[half:], numbers[half:], fail)
+
+def import_profiles(records, chunk_size=IMPORT_CHUNK_SIZE, dry_run=False):
+    """
+    Validate and insert (row_number, record, parse_error) items from
+    iter_records. Each chunk's valid rows go in one bulk insert; rows the
+    database rejects are found by splitting the chunk and reported row by
+    row, and the import continues. Errors are reported in row order.
+    Must run inside an app context.
+    Returns a summary dict; `valid` counts rows inserted, or with dry_run
+    (nothing inserted) the rows that passed validation.
+    """
+    summary = {"received": 0, "valid": 0, "inserted": 0, "failed": 0, "errors": []}
+    start = time.perf_counter()
+    # One chunk's parse, validation and insert failures, reported sorted by row
+    failures = []
+
+    def fail(number, errors):
+        failures.append((number, errors))
+
+    for chunk in _chunks(records, max(int(chunk_size), 1)):
+        summary["received"] += len(chunk)
+        failures.clear()
+        parsed = []
+        for number, record, error in chunk:
+            if error:
+                fail(number, [error])
+            else:
+                parsed.append((number, record))
+
+        rows, numbers = [], []
+        for (number, record), errors in zip(parsed, validate_chunk([r for _, r in parsed])):
+            if errors:
+                fail(number, errors)
+            else:
+                rows.append(profile_row(record))
+                numbers.append(number)
+
+        if dry_run:
+            summary["valid"] += len(rows)
+        elif rows:
+            inserted = _insert(rows, numbers, fail)
+            summary["valid"] += inserted
+            summary["inserted"] += inserted
+
+        summary["failed"] += len(failures)
+        for number, errors in sorted(failures, key=lambda failure: failure[0]):
+            if len(summary["errors"]) >= MAX_REPORTED_ERRORS:
+                break
+            summary["errors"].append({"row": number, "errors": errors})
+
+    summary["seconds"] = round(time.perf_counter() - start, 3)
+    summary["errors_truncated"] = summary["failed"] > len(summary["errors"])
+    return summary
+
+def import_stream(binary_stream, fmt, chunk_size=IMPORT_CHUNK_SIZE, dry_run=False):
+    """Import from a binary stream (request body or open file) of UTF-8 text."""
+    text_stream = io.TextIOWrapper(binary_stream, encoding="utf-8-sig", newline="")
+    return import_profiles(iter_records(text_stream, fmt), chunk_size, dry_run)
+
+# ---------- CLI ----------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import farm profiles from CSV or NDJSON.")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, help="Default: from the file extension")
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="Validate only, insert nothing")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or detect_format(args.path)
+    app = create_cli_app()
+    with app.app_context(), open(args.path, "rb") as f:
+        summary = import_stream(f, fmt, args.chunk_size, args.dry_run)
+    for error in summary["errors"]:
+        logging.warning(f"Row {error['row']}: {'; '.join(error['errors'])}")
+    logging.info(f"Import complete: {summary['received']} rows, {summary['inserted']} inserted, "
+                 f"{summary['failed']} failed in {summary['seconds']}s")
+    return 0 if summary["failed"] == 0 else 1
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    raise SystemExit(main())
@@ -0,0 +1,119 @@
+"""
+AgriAssist AI - Feature Transform Service
+Phase 2: Advisory Engine + Dashboard Integration
+
+Applies the transformers fitted during Phase 1 preprocessing to live readings.
+Specs are read from the JSON artifacts in models_store/transformers (written
+by data_preprocessing.save_transformer), so request-time feature preparation
+only needs NumPy: scaling is (x - mean) / scale over precomputed arrays and
+label encoding is a dict lookup.
+"""
+
+import os
+import json
+import threading
+import numpy as np
+
+TRANSFORMERS_DIR = os.getenv("FEATURE_TRANSFORMERS_DIR", "models_store/transformers")
+UNKNOWN_LABEL = -1
+
+# ---------- TRANSFORMERS ----------
+class ScalerTransform:
+    """StandardScaler equivalent over precomputed mean/scale arrays."""
+
+    def __init__(self, spec):
+        self.name = spec.get("name")
+        self.version = spec.get("version")
+        self.columns = list(spec["columns"])
+        self.mean = np.asarray(spec["mean"], dtype=np.float64)
+        self.scale = np.asarray(spec["scale"], dtype=np.float64)
+
+    def transform(self, rows):
+        """Scale an (n, len(columns)) array-like, columns in spec order."""
+        return (np.asarray(rows, dtype=np.float64) - self.mean) / self.scale
+
+    def transform_record(self, record: dict):
+        """
+        Return a copy of `record` with the spec columns scaled. Spec columns
+        the record lacks (or holds as None) are passed through untouched.
+        """
+        out = dict(record)
+        for i, col in enumerate(self.columns):
+            if record.get(col) is not None:
+                out[col] = float((float(record[col]) - self.mean[i]) / self.scale[i])
+        return out
+
+class LabelTransform:
+    """LabelEncoder equivalent backed by a class -> code dict."""
+
+    def __init__(self, spec):
+        self.name = spec.get("name")
+        self.version = spec.get("version")
+        self.column = spec["column"]
+        self.classes = list(spec["classes"])
+        self.codes = {label: code for code, label in enumerate(self.classes)}
+
+    def transform(self, values, unknown=UNKNOWN_LABEL):
+        """Encode an iterable of labels; unseen labels map to `unknown`."""
+        codes = self.codes
+        return np.fromiter((codes.get(v, unknown) for v in values), dtype=np.int64)
+
+    def transform_one(self, value, unknown=UNKNOWN_LABEL):
+        return self.codes.get(value, unknown)
+
+    def inverse(self, code):
+        return self.classes[code] if 0 <= code < len(self.classes) else None
+
+_KINDS = {"standard_scaler": ScalerTransform, "label_encoder": LabelTransform}
+
+# ---------- LOADING ----------
+_cache = {}
+# (directory, name) -> ((size, mtime_ns) of <name>.json, current version)
+_current = {}
+_lock = threading.Lock()
+
+def _read_spec(path):
+    with open(path) as f:
+        return json.load(f)
+
+def current_version(name, directory=TRANSFORMERS_DIR):
+    """
+    Version named by the <name>.json pointer. The pointer is re-read only
+    when its size or mtime changes (save_transformer replaces it atomically).
+    """
+    path = os.path.join(directory, f"{name}.json")
+    st = os.stat(path)
+    signature = (st.st_size, st.st_mtime_ns)
+    key = (os.path.abspath(directory), name)
+    entry = _current.get(key)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+    version = _read_spec(path)["version"]
+    _current[key] = (signature, version)
+    return version
+
+def load_transform(name, version=None, directory=TRANSFORMERS_DIR):
+    """
+    Return the transform for `name`: the current version (<name>.json)
+    unless a version is given. Raises FileNotFoundError if no artifact has
+    been saved for it.
+    """
+    if version is None:
+        version = current_version(name, directory)
+    key = (os.path.abspath(directory), name, version)
+    transform = _cache.get(key)
+    if transform is not None:
+        return transform
+
+    with _lock:
+        transform = _cache.get(key)
+        if transform is None:
+            spec = _read_spec(os.path.join(directory, f"{name}-{version}.json"))
+            transform = _cache[key] = _KINDS[spec["kind"]](spec)
+    return transform
+
+def clear_cache():
+    """Forget loaded specs (e.g. after preprocessing was rerun)."""
+    with _lock:
+        _cache.clear()
+        _current.clear()
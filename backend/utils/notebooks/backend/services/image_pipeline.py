@@ -0,0 +1,97 @@
+"""
+AgriAssist AI - Image Preprocessing Pipeline
+Phase 2: Advisory Engine + Dashboard Integration
+
+Decodes crop images straight into preallocated float32 batch buffers for CNN
+inference. Large JPEGs are decoded at reduced size (PIL draft mode) before the
+final resize, and scaling to 0-1 is a single fused NumPy step per image.
+"""
+
+import os
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from PIL import Image
+
+# ---------- CONFIG ----------
+TARGET_SIZE = (224, 224)  # (height, width), same convention as Keras
+PREPROCESS_WORKERS = int(os.getenv("CROP_HEALTH_PREPROCESS_WORKERS", 4))
+# Use JPEG draft decoding when the source is at least this many times larger
+DRAFT_FACTOR = 2
+# Keras load_img resizes with nearest-neighbour by default; keep parity
+RESAMPLE = Image.NEAREST
+
+_SCALE = np.float32(1.0 / 255.0)
+
+# ---------- SHARED THREAD POOL ----------
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool():
+    """Return the shared preprocessing thread pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=PREPROCESS_WORKERS,
+                                           thread_name_prefix="img-preprocess")
+    return _pool
+
+# ---------- SINGLE IMAGE ----------
+def load_rgb(source, target_size=TARGET_SIZE):
+    """
+    Open an image (path or file-like object) as an RGB PIL image of target_size.
+    """
+    height, width = target_size
+    img = Image.open(source)
+    if (img.format == "JPEG" and img.width >= DRAFT_FACTOR * width
+            and img.height >= DRAFT_FACTOR * height):
+        # Decoder downscales by 1/2, 1/4 or 1/8 while staying >= requested size
+        img.draft("RGB", (width, height))
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    if img.size != (width, height):
+        img = img.resize((width, height), RESAMPLE)
+    return img
+
+def write_normalized(img, out):
+    """
+    Write the image into `out` (float32, HxWx3) scaled to 0-1 in one pass.
+    """
+    np.multiply(np.asarray(img, dtype=np.uint8), _SCALE, out=out, dtype=np.float32)
+    return out
+
+# ---------- BATCHES ----------
+def allocate_batch(batch_size, target_size=TARGET_SIZE):
+    """Allocate an uninitialised float32 batch buffer of shape (n, H, W, 3)."""
+    return np.empty((batch_size, target_size[0], target_size[1], 3), dtype=np.float32)
+
+def fill_batch(sources, out, parallel=True):
+    """
+    Decode `sources` into out[:len(sources)] on the shared thread pool.
+    Returns a list of booleans marking which rows were decoded successfully.
+    """
+    target_size = out.shape[1:3]
+
+    def _fill(i):
+        try:
+            write_normalized(load_rgb(sources[i], target_size), out[i])
+            return True
+        except Exception as e:
+            logging.warning(f"Could not preprocess {sources[i]}: {e}")
+            return False
+
+    if not parallel or len(sources) <= 1:
+        return [_fill(i) for i in range(len(sources))]
+    return list(get_pool().map(_fill, range(len(sources))))
+
+def valid_rows(out, ok):
+    """
+    Return the decoded rows of a filled batch. A view when every row
+    succeeded, otherwise a compacted copy.
+    """
+    n = len(ok)
+    if all(ok):
+        return out[:n]
+    return out[np.flatnonzero(ok)]
@@ -0,0 +1,225 @@
+"""
+AgriAssist AI - Crop Health Inference Backends
+Phase 2: Advisory Engine + Dashboard Integration
+
+Pluggable runtimes for the crop health CNN. Every backend exposes
+`predict(batch) -> np.ndarray` of class probabilities, so the rest of the
+service does not care whether it runs Keras, a quantized TFLite model or ONNX.
+
+Conversion and accuracy parity check (run from the backend parent folder):
+    python -m backend.services.inference_backends tflite-int8 --samples uploads/
+"""
+
+import os
+import glob
+import logging
+import argparse
+import threading
+import numpy as np
+
+BACKENDS = ("keras", "tflite", "onnx")
+QUANTIZATION_MODES = ("none", "dynamic", "int8")
+
+# ---------- KERAS ----------
+class KerasBackend:
+    """Full-precision Keras model (.h5)."""
+    name = "keras"
+
+    def __init__(self, path):
+        from tensorflow.keras.models import load_model
+        self.model = load_model(path)
+
+    def predict(self, batch):
+        return self.model.predict(batch, verbose=0)
+
+# ---------- TFLITE ----------
+def _tflite_interpreter(path):
+    try:
+        from tflite_runtime.interpreter import Interpreter
+    except ImportError:
+        from tensorflow.lite import Interpreter
+    return Interpreter(model_path=path)
+
+class TFLiteBackend:
+    """
+    TFLite model run with the lightweight interpreter (tflite_runtime if
+    installed, else tf.lite). Handles int8/uint8 quantized input and output.
+    """
+    name = "tflite"
+
+    def __init__(self, path):
+        self.interpreter = _tflite_interpreter(path)
+        self.interpreter.allocate_tensors()
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+        self._batch_size = int(self._input["shape"][0])
+        # The interpreter is stateful, so calls are serialised
+        self._lock = threading.Lock()
+
+    def _resize(self, batch_size):
+        if batch_size != self._batch_size:
+            shape = list(self._input["shape"])
+            shape[0] = batch_size
+            self.interpreter.resize_tensor_input(self._input["index"], shape)
+            self.interpreter.allocate_tensors()
+            self._input = self.interpreter.get_input_details()[0]
+            self._output = self.interpreter.get_output_details()[0]
+            self._batch_size = batch_size
+
+    def predict(self, batch):
+        with self._lock:
+            self._resize(len(batch))
+            dtype = self._input["dtype"]
+            if dtype in (np.int8, np.uint8):
+                scale, zero_point = self._input["quantization"]
+                batch = np.clip(np.round(batch / scale + zero_point),
+                                np.iinfo(dtype).min, np.iinfo(dtype).max)
+            self.interpreter.set_tensor(self._input["index"], batch.astype(dtype, copy=False))
+            self.interpreter.invoke()
+            out = self.interpreter.get_tensor(self._output["index"])
+            if self._output["dtype"] in (np.int8, np.uint8):
+                scale, zero_point = self._output["quantization"]
+                out = (out.astype(np.float32) - zero_point) * scale
+            return out.copy()
+
+# ---------- ONNX ----------
+class OnnxBackend:
+    """ONNX model run with onnxruntime on CPU."""
+    name = "onnx"
+
+    def __init__(self, path):
+        import onnxruntime as ort
+        self.session = ort.InferenceSession(path, providers=["CPUExecutionProvider"])
+        self._input_name = self.session.get_inputs()[0].name
+
+    def predict(self, batch):
+        return self.session.run(None, {self._input_name: batch.astype(np.float32, copy=False)})[0]
+
+def load_backend(kind, path):
+    """
+    Instantiate the backend `kind` ("keras", "tflite" or "onnx") for `path`.
+    """
+    if kind == "keras":
+        return KerasBackend(path)
+    if kind == "tflite":
+        return TFLiteBackend(path)
+    if kind == "onnx":
+        return OnnxBackend(path)
+    raise ValueError(f"Unknown crop health backend: {kind}. Expected one of {BACKENDS}.")
+
+# ---------- CONVERSION ----------
+def convert_to_tflite(keras_path, out_path, quantization="dynamic", representative=None):
+    """
+    Convert a Keras model to TFLite.
+    quantization: "none", "dynamic" (int8 weights, float activations) or
+    "int8" (full integer; needs `representative`, an array of sample inputs).
+    """
+    import tensorflow as tf
+
+    if quantization not in QUANTIZATION_MODES:
+        raise ValueError(f"Unknown quantization mode: {quantization}")
+    model = tf.keras.models.load_model(keras_path)
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    if quantization in ("dynamic", "int8"):
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if quantization == "int8":
+        if representative is None or len(representative) == 0:
+            raise ValueError("int8 quantization requires representative sample images.")
+
+        def _dataset():
+            for i in range(len(representative)):
+                yield [representative[i:i + 1].astype(np.float32)]
+
+        converter.representative_dataset = _dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+
+    with open(out_path, "wb") as f:
+        f.write(converter.convert())
+    logging.info(f"TFLite model ({quantization}) written to {out_path}")
+    return out_path
+
+def convert_to_onnx(keras_path, out_path, opset=13):
+    """Convert a Keras model to ONNX using tf2onnx."""
+    import tensorflow as tf
+    import tf2onnx
+
+    model = tf.keras.models.load_model(keras_path)
+    spec = (tf.TensorSpec((None,) + tuple(model.input_shape[1:]), tf.float32, name="input"),)
+    tf2onnx.convert.from_keras(model, input_signature=spec, opset=opset, output_path=out_path)
+    logging.info(f"ONNX model written to {out_path}")
+    return out_path
+
+# ---------- ACCURACY PARITY ----------
+def check_parity(reference, candidate, samples, batch_size=32, min_agreement=0.98):
+    """
+    Compare a candidate backend against the reference on `samples`
+    (float32 array of shape (n, H, W, 3)). Returns top-1 agreement and
+    probability differences; `passed` is True when agreement >= min_agreement.
+    """
+    agree = 0
+    max_diff = 0.0
+    total_diff = 0.0
+    values = 0
+    n = len(samples)
+    for start in range(0, n, batch_size):
+        chunk = samples[start:start + batch_size]
+        ref = np.asarray(reference.predict(chunk), dtype=np.float32)
+        cand = np.asarray(candidate.predict(chunk), dtype=np.float32)
+        agree += int(np.sum(np.argmax(ref, axis=1) == np.argmax(cand, axis=1)))
+        diff = np.abs(ref - cand)
+        max_diff = max(max_diff, float(diff.max()))
+        total_diff += float(diff.sum(dtype=np.float64))
+        values += diff.size
+    agreement = agree / n if n else 0.0
+    return {
+        "samples": n,
+        "top1_agreement": agreement,
+        "max_abs_diff": max_diff,
+        # Over every class probability of every sample
+        "mean_abs_diff": total_diff / values if values else 0.0,
+        "passed": n > 0 and agreement >= min_agreement,
+    }
+
+def load_samples(folder, limit=256):
+    """Preprocess up to `limit` images from `folder` into one sample array."""
+    from backend.services import image_pipeline
+
+    paths = sorted(p for ext in ("*.jpg", "*.jpeg", "*.png")
+                   for p in glob.glob(os.path.join(folder, ext)))[:limit]
+    out = image_pipeline.allocate_batch(len(paths))
+    ok = image_pipeline.fill_batch(paths, out)
+    return image_pipeline.valid_rows(out, ok)
+
+# ---------- CLI ----------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert the crop health CNN and check accuracy parity.")
+    parser.add_argument("target", choices=["tflite", "tflite-dynamic", "tflite-int8", "onnx"])
+    parser.add_argument("--model", default=os.getenv("CROP_HEALTH_MODEL", "models_store/crop_health_cnn.h5"))
+    parser.add_argument("--out", help="Output path (default: next to the Keras model)")
+    parser.add_argument("--samples", help="Folder of sample images for int8 calibration and parity")
+    parser.add_argument("--min-agreement", type=float, default=0.98)
+    args = parser.parse_args(argv)
+
+    samples = load_samples(args.samples) if args.samples else None
+    stem = os.path.splitext(args.model)[0]
+    if args.target == "onnx":
+        out = convert_to_onnx(args.model, args.out or f"{stem}.onnx")
+        kind = "onnx"
+    else:
+        mode = {"tflite": "none", "tflite-dynamic": "dynamic", "tflite-int8": "int8"}[args.target]
+        out = convert_to_tflite(args.model, args.out or f"{stem}_{mode}.tflite", mode, samples)
+        kind = "tflite"
+
+    if samples is None:
+        logging.warning("No --samples given; skipping accuracy parity check.")
+        return 0
+    report = check_parity(KerasBackend(args.model), load_backend(kind, out), samples,
+                          min_agreement=args.min_agreement)
+    logging.info(f"Parity vs Keras: {report}")
+    return 0 if report["passed"] else 1
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    raise SystemExit(main())
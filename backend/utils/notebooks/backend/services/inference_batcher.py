@@ -0,0 +1,152 @@
+"""
+AgriAssist AI - Inference Micro-Batcher
+Phase 2: Advisory Engine + Dashboard Integration
+
+This module gathers concurrent single-image inference requests into one
+batched `predict` call and fans the per-image results back out to callers.
+A batch is dispatched when it reaches `max_batch_size` or when the oldest
+request has waited `max_wait_ms`, whichever comes first.
+"""
+
+import time
+import queue
+import logging
+import threading
+from concurrent.futures import Future
+import numpy as np
+
+# ---------- HISTOGRAM ----------
+def _bucket(value):
+    """Power-of-two bucket label for a non-negative count (0, 1, 2, 4, 8, ...)."""
+    if value <= 0:
+        return "0"
+    upper = 1
+    while upper < value:
+        upper *= 2
+    return str(upper)
+
+# ---------- BATCHER ----------
+class MicroBatcher:
+    """
+    Collects inputs of shape (n, ...) from many threads and runs them through
+    `predict_fn` as a single concatenated batch on a background worker.
+    """
+
+    def __init__(self, predict_fn, max_batch_size=16, max_wait_ms=10, name="batcher"):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max(int(max_batch_size), 1)
+        self.max_wait = max(float(max_wait_ms), 0.0) / 1000.0
+        self.name = name
+        self._queue = queue.Queue()
+        self._worker = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self._batches = 0
+        self._items = 0
+        self._max_queue_depth = 0
+        self._batch_size_hist = {}
+        self._queue_depth_hist = {}
+        self._wait_seconds_total = 0.0
+        self._predict_seconds_total = 0.0
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._start_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name=f"{self.name}-worker", daemon=True
+                )
+                self._worker.start()
+
+    def submit(self, inputs):
+        """
+        Queue `inputs` (an array with a leading batch axis) and return a Future
+        resolving to the matching rows of the model output.
+        """
+        self._ensure_worker()
+        future = Future()
+        self._queue.put((inputs, future, time.perf_counter()))
+        return future
+
+    def predict(self, inputs, timeout=None):
+        """Submit `inputs` and block until its predictions are ready."""
+        return self.submit(inputs).result(timeout=timeout)
+
+    def _collect(self):
+        first = self._queue.get()
+        batch = [first]
+        rows = len(first[0])
+        deadline = first[2] + self.max_wait
+        while rows < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(item)
+            rows += len(item[0])
+        return batch, rows
+
+    def _run(self):
+        while True:
+            batch, rows = self._collect()
+            depth = self._queue.qsize()
+            dispatched = time.perf_counter()
+            try:
+                stacked = np.concatenate([item[0] for item in batch], axis=0)
+                preds = np.asarray(self.predict_fn(stacked))
+            except Exception as e:
+                logging.error(f"{self.name}: batched predict failed: {e}")
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            finished = time.perf_counter()
+
+            offset = 0
+            for inputs, future, _ in batch:
+                n = len(inputs)
+                future.set_result(preds[offset:offset + n])
+                offset += n
+
+            with self._stats_lock:
+                self._batches += 1
+                self._items += rows
+                self._max_queue_depth = max(self._max_queue_depth, depth)
+                size_key = str(rows)
+                self._batch_size_hist[size_key] = self._batch_size_hist.get(size_key, 0) + 1
+                depth_key = _bucket(depth)
+                self._queue_depth_hist[depth_key] = self._queue_depth_hist.get(depth_key, 0) + 1
+                self._wait_seconds_total += sum(dispatched - item[2] for item in batch)
+                self._predict_seconds_total += finished - dispatched
+
+    def stats(self):
+        """
+        Return queue depth, batch-size / queue-depth histograms and timings.
+        """
+        with self._stats_lock:
+            batches = self._batches
+            return {
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000.0,
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self._max_queue_depth,
+                "batches": batches,
+                "items": self._items,
+                "mean_batch_size": self._items / batches if batches else 0.0,
+                "batch_size_histogram": dict(sorted(self._batch_size_hist.items(), key=lambda kv: int(kv[0]))),
+                "queue_depth_histogram": dict(sorted(self._queue_depth_hist.items(), key=lambda kv: int(kv[0]))),
+                "mean_wait_ms": 1000.0 * self._wait_seconds_total / self._items if self._items else 0.0,
+                "mean_predict_ms": 1000.0 * self._predict_seconds_total / batches if batches else 0.0,
+            }
+
+    def reset_stats(self):
+        """Clear all counters and histograms."""
+        with self._stats_lock:
+            self._reset_stats()
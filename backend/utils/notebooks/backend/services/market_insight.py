@@ -3,36 +3,335 @@ AgriAssist AI - Market Insight Service
 Phase 2: Advisory Engine + Dashboard Integration
 
 This module analyzes market price data and generates insights for advisories.
+
+Insights for every crop are computed in a single groupby pass and kept in an
+in-memory index per CSV file. The index is refreshed only when the file changes
+(mtime/size by default, or content hash with MARKET_INDEX_VALIDATION=hash),
+so crop lookups are O(1) dictionary hits. When the feed only appended rows,
+IncrementalMarketTrends consumes just the new bytes instead of re-reading
+the whole history. Full loads use the typed preprocessed copy
+(market_prices_clean.parquet) when it is fresh and holds the same rows.
 """
 
+import io
+import os
+import math
+import zlib
+import hashlib
+import logging
+import threading
 import pandas as pd
+from backend.utils.dataset_io import read_table, read_columnar, columnar_path
 
-def analyze_market_data(csv_path="datasets/market_prices.csv"):
+TREND_WINDOW = 5
+MARKET_COLUMNS = ["date", "crop", "price"]
+VALIDATION_MODE = os.getenv("MARKET_INDEX_VALIDATION", "mtime").lower()
+INCREMENTAL = os.getenv("MARKET_INDEX_INCREMENTAL", "True").lower() in ("true", "1", "yes")
+
+# ---------- ANALYSIS ----------
+def _csv_rows(f):
+    """Data rows in an open binary CSV (lines after the header)."""
+    f.seek(0)
+    newlines, last = 0, b""
+    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+        newlines += chunk.count(b"\n")
+        last = chunk
+    unterminated = 1 if last and not last.endswith(b"\n") else 0
+    return max(newlines + unterminated - 1, 0)
+
+def cleaned_market_data(csv_path, f=None):
     """
-    Analyze market dataset and return average prices and trends.
+    Rows of the fresh preprocessed columnar copy of `csv_path`, or None.
+    The copy is only used when preprocessing dropped no rows (same row count
+    as the CSV), so insights stay exactly those of the raw file.
     """
-    df = pd.read_csv(csv_path)
+    path = columnar_path(csv_path, cleaned=True)
+    if path is None:
+        return None
+    try:
+        df = read_columnar(path, MARKET_COLUMNS)
+    except (ImportError, OSError, ValueError) as e:
+        logging.warning(f"Could not read {path}, using the CSV: {e}")
+        return None
+    if f is None:
+        with open(csv_path, "rb") as f:
+            rows = _csv_rows(f)
+    else:
+        rows = _csv_rows(f)
+    return df if len(df) == rows else None
+
+def _drop_bad_dates(df):
     if "date" in df.columns:
         df["date"] = pd.to_datetime(df["date"], errors="coerce")
         df = df.dropna(subset=["date"])
+    return df
+
+def load_market_data(csv_path):
+    """
+    Read the market dataset (typed preprocessed copy if usable, else CSV) and
+    drop rows with unparseable dates. Only the columns insights need are loaded.
+    """
+    df = cleaned_market_data(csv_path)
+    if df is None:
+        df = read_table(csv_path, columns=MARKET_COLUMNS)
+    return _drop_bad_dates(df)
+
+def compute_market_insights(df):
+    """
+    Average price and recent trend for every crop in one groupby pass.
+    Trend compares the last and first of the latest TREND_WINDOW prices
+    (by date) when a crop has more than TREND_WINDOW rows.
+    """
+    if df.empty:
+        return {}
+    crop_order = df["crop"].unique()
+    ordered = df.sort_values("date", kind="mergesort") if "date" in df.columns else df
+    grouped = ordered.groupby("crop", sort=False, observed=True)["price"]
+
+    avg_price = grouped.mean()
+    counts = grouped.size()
+    # Position from the end within each crop: 0 = latest price
+    from_end = grouped.cumcount(ascending=False)
+    last = ordered.loc[from_end == 0].set_index("crop")["price"]
+    window_start = ordered.loc[from_end == TREND_WINDOW - 1].set_index("crop")["price"]
 
     insights = {}
-    for crop in df["crop"].unique():
-        crop_df = df[df["crop"] == crop].sort_values("date")
-        avg_price = crop_df["price"].mean()
+    for crop in crop_order:
         trend = "stable"
-        if len(crop_df) > 5:
-            recent = crop_df.tail(5)["price"].values
-            if recent[-1] > recent[0]:
+        if counts[crop] > TREND_WINDOW:
+            if last[crop] > window_start[crop]:
                 trend = "rising"
-            elif recent[-1] < recent[0]:
+            elif last[crop] < window_start[crop]:
                 trend = "falling"
-        insights[crop] = {"avg_price": round(avg_price, 2), "trend": trend}
+        insights[crop] = {"avg_price": round(float(avg_price[crop]), 2), "trend": trend}
     return insights
 
+# ---------- INCREMENTAL ----------
+class _CropState:
+    __slots__ = ("price_sum", "price_comp", "priced", "rows", "window")
+
+    def __init__(self):
+        self.price_sum = 0.0
+        self.price_comp = 0.0   # Neumaier compensation for the running sum
+        self.priced = 0         # non-NaN prices (mean denominator)
+        self.rows = 0           # all rows (trend threshold)
+        self.window = []        # latest TREND_WINDOW (date, seq, price), oldest first
+
+    def add_sum(self, value):
+        total = self.price_sum + value
+        if abs(self.price_sum) >= abs(value):
+            self.price_comp += (self.price_sum - total) + value
+        else:
+            self.price_comp += (value - total) + self.price_sum
+        self.price_sum = total
+
+class IncrementalMarketTrends:
+    """
+    Running per-crop price sums/counts plus a window of the latest prices,
+    updated from rows appended to the CSV since the last tracked byte offset.
+    insights() matches compute_market_insights on the full file. A row is
+    consumed once its terminating newline has been written.
+    """
+
+    TAIL_CHECK_BYTES = 4096
+
+    def __init__(self, csv_path, window=TREND_WINDOW):
+        self.csv_path = csv_path
+        self.window = window
+        self._reset()
+
+    def _reset(self):
+        self.offset = 0
+        self.columns = None
+        self._header = b""
+        self._tail_crc = 0
+        self._seq = 0
+        self._crops = {}
+
+    def _tail_checksum(self, f, end):
+        start = max(end - self.TAIL_CHECK_BYTES, 0)
+        f.seek(start)
+        return zlib.crc32(f.read(end - start))
+
+    def _is_append(self, f, size):
+        """True when the already consumed prefix is unchanged."""
+        if self.columns is None or size < self.offset:
+            return False
+        f.seek(0)
+        if f.readline() != self._header:
+            return False
+        return self._tail_checksum(f, self.offset) == self._tail_crc
+
+    def refresh(self):
+        """
+        Consume rows appended since the last call (or the whole file the first
+        time, or after the file was rewritten). Returns the number of rows read.
+        """
+        with open(self.csv_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if not self._is_append(f, size):
+                self._reset()
+                f.seek(0)
+                self._header = f.readline()
+                self.columns = pd.read_csv(io.BytesIO(self._header)).columns.tolist()
+                self.offset = len(self._header)
+                seeded = self._seed(f, size)
+                if seeded is not None:
+                    return seeded
+
+            f.seek(self.offset)
+            data = f.read(size - self.offset)
+            # Only consume complete lines; a partially written row waits
+            end = data.rfind(b"\n") + 1
+            if end == 0:
+                return 0
+            data = data[:end]
+            self.offset += end
+            self._tail_crc = self._tail_checksum(f, self.offset)
+
+        df = pd.read_csv(io.BytesIO(data), header=None, names=self.columns)
+        if "date" in df.columns:
+            df["date"] = pd.to_datetime(df["date"], errors="coerce")
+            df = df.dropna(subset=["date"])
+        self._consume(df)
+        return len(df)
+
+    def _seed(self, f, size):
+        """
+        Consume the whole file from its preprocessed columnar copy when that
+        is usable and the CSV ends on a complete row. Returns rows read or None.
+        """
+        f.seek(max(size - 1, 0))
+        if size == 0 or f.read(1) != b"\n":
+            return None
+        df = cleaned_market_data(self.csv_path, f)
+        if df is None:
+            return None
+        self.offset = size
+        self._tail_crc = self._tail_checksum(f, size)
+        df = _drop_bad_dates(df)
+        self._consume(df)
+        return len(df)
+
+    def _consume(self, df):
+        if df.empty:
+            return
+        df = df.assign(_seq=range(self._seq, self._seq + len(df)))
+        self._seq += len(df)
+        ordered = df.sort_values("date", kind="mergesort") if "date" in df.columns else df
+        grouped = ordered.groupby("crop", sort=False, observed=True)["price"]
+        sums = grouped.agg(lambda p: math.fsum(p.dropna()))
+        priced = grouped.count()
+        rows = grouped.size()
+        from_end = grouped.cumcount(ascending=False)
+        tail = ordered.loc[from_end < self.window]
+        dates = tail["date"] if "date" in tail.columns else tail["_seq"]
+        latest = {}
+        for crop, date, seq, price in zip(tail["crop"], dates, tail["_seq"], tail["price"]):
+            latest.setdefault(crop, []).append((date, seq, price))
+
+        # First appearance order in the file, as crop_order in the batch path
+        for crop in df["crop"].unique():
+            state = self._crops.get(crop)
+            if state is None:
+                state = self._crops[crop] = _CropState()
+            state.add_sum(float(sums[crop]))
+            state.priced += int(priced[crop])
+            state.rows += int(rows[crop])
+            merged = sorted(state.window + latest[crop], key=lambda item: (item[0], item[1]))
+            state.window = merged[-self.window:]
+
+    def insights(self):
+        """Current {crop: {"avg_price", "trend"}} for all rows consumed so far."""
+        insights = {}
+        for crop, state in self._crops.items():
+            total = state.price_sum + state.price_comp
+            avg_price = total / state.priced if state.priced else float("nan")
+            trend = "stable"
+            if state.rows > self.window:
+                first, last = state.window[0][2], state.window[-1][2]
+                if last > first:
+                    trend = "rising"
+                elif last < first:
+                    trend = "falling"
+            insights[crop] = {"avg_price": round(avg_price, 2), "trend": trend}
+        return insights
+
+# ---------- INDEX ----------
+def _file_signature(csv_path, mode=VALIDATION_MODE):
+    st = os.stat(csv_path)
+    if mode != "hash":
+        return (st.st_size, st.st_mtime_ns)
+    digest = hashlib.sha256()
+    with open(csv_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return (st.st_size, digest.hexdigest())
+
+class MarketInsightIndex:
+    """
+    Per-file cache of crop insights, rebuilt when the file signature changes.
+    """
+
+    def __init__(self, validation=VALIDATION_MODE, incremental=INCREMENTAL):
+        self.validation = validation
+        self.incremental = incremental
+        self._entries = {}
+        self._trends = {}
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    def insights(self, csv_path):
+        """Return the (shared, read-only) insight dict for `csv_path`."""
+        key = os.path.abspath(csv_path)
+        signature = _file_signature(csv_path, self.validation)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                return entry[1]
+            if self.incremental:
+                trends = self._trends.get(key)
+                if trends is None:
+                    trends = self._trends[key] = IncrementalMarketTrends(csv_path)
+                trends.refresh()
+                insights = trends.insights()
+            else:
+                insights = compute_market_insights(load_market_data(csv_path))
+            self._entries[key] = (signature, insights)
+            self.builds += 1
+            logging.info(f"Market insight index built for {csv_path}: {len(insights)} crops")
+            return insights
+
+    def get(self, crop_name, csv_path):
+        """O(1) lookup of one crop's insight (None if unknown)."""
+        return self.insights(csv_path).get(crop_name)
+
+    def invalidate(self, csv_path=None):
+        """Drop the cached index for one file, or for all files."""
+        with self._lock:
+            if csv_path is None:
+                self._entries.clear()
+                self._trends.clear()
+            else:
+                self._entries.pop(os.path.abspath(csv_path), None)
+                self._trends.pop(os.path.abspath(csv_path), None)
+
+index = MarketInsightIndex()
+
+# ---------- PUBLIC API ----------
+def analyze_market_data(csv_path="datasets/market_prices.csv"):
+    """
+    Analyze market dataset and return average prices and trends.
+    """
+    return {crop: dict(insight) for crop, insight in index.insights(csv_path).items()}
+
 def get_crop_insight(crop_name, csv_path="datasets/market_prices.csv"):
     """
     Get market insight for a specific crop.
     """
-    insights = analyze_market_data(csv_path)
-    return insights.get(crop_name, {"avg_price": None, "trend": "unknown"})
+    insight = index.get(crop_name, csv_path)
+    return dict(insight) if insight else {"avg_price": None, "trend": "unknown"}
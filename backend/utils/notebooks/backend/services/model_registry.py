@@ -0,0 +1,162 @@
+"""
+AgriAssist AI - Model Registry Service
+Phase 2: Advisory Engine + Dashboard Integration
+
+This module keeps one shared, lazily loaded instance of each model artifact.
+Models are loaded on first use (or on an explicit warm-up call), so importing
+the API does not pull in heavy ML frameworks or touch models_store.
+"""
+
+import os
+import time
+import logging
+import threading
+
+# ---------- ERRORS ----------
+class ModelUnavailableError(RuntimeError):
+    """Raised when a registered model cannot be found or loaded."""
+
+# ---------- MEMORY HELPERS ----------
+def _current_rss_bytes():
+    """
+    Return the resident set size of this process in bytes (0 if unknown).
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        # ru_maxrss is the peak RSS (KiB on Linux); best effort elsewhere
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except (ImportError, AttributeError):
+        return 0
+
+# ---------- REGISTRY ----------
+class _ModelEntry:
+    def __init__(self, name, path, loader):
+        self.name = name
+        self.path = path
+        self.loader = loader
+        self.model = None
+        self.error = None
+        self.load_seconds = None
+        self.memory_bytes = None
+        self.loaded_at = None
+        self.lock = threading.Lock()
+
+class ModelRegistry:
+    """
+    Thread-safe registry of lazily loaded models, shared by all request threads.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, path, loader):
+        """
+        Register a model under `name`. `loader(path)` is called on first use.
+        """
+        with self._lock:
+            self._entries[name] = _ModelEntry(name, path, loader)
+
+    def _entry(self, name):
+        entry = self._entries.get(name)
+        if entry is None:
+            raise ModelUnavailableError(f"Model '{name}' is not registered.")
+        return entry
+
+    def get(self, name):
+        """
+        Return the loaded model, loading it once if needed.
+        """
+        entry = self._entry(name)
+        if entry.model is not None:
+            return entry.model
+
+        with entry.lock:
+            if entry.model is not None:
+                return entry.model
+            if not os.path.exists(entry.path):
+                entry.error = f"Model file not found: {entry.path}"
+                raise ModelUnavailableError(entry.error)
+
+            rss_before = _current_rss_bytes()
+            start = time.perf_counter()
+            try:
+                model = entry.loader(entry.path)
+            except Exception as e:
+                entry.error = f"Failed to load model '{name}': {e}"
+                logging.error(entry.error)
+                raise ModelUnavailableError(entry.error) from e
+
+            entry.load_seconds = time.perf_counter() - start
+            entry.memory_bytes = max(_current_rss_bytes() - rss_before, 0)
+            entry.loaded_at = time.time()
+            entry.error = None
+            entry.model = model
+            logging.info(
+                f"Model '{name}' loaded in {entry.load_seconds:.2f}s "
+                f"(+{entry.memory_bytes / 1e6:.1f} MB RSS)"
+            )
+        return entry.model
+
+    def version(self, name):
+        """
+        Return a version string for the model file (size and mtime), used to
+        key cached results. Changes whenever the artifact is replaced.
+        """
+        entry = self._entry(name)
+        try:
+            st = os.stat(entry.path)
+        except OSError:
+            return "missing"
+        return f"{st.st_size}-{st.st_mtime_ns}"
+
+    def is_loaded(self, name):
+        """Return True if the model has already been loaded."""
+        return self._entry(name).model is not None
+
+    def warm_up(self, *names):
+        """
+        Load the given models (all registered models if none given).
+        Returns {name: error message or None}.
+        """
+        results = {}
+        for name in names or list(self._entries):
+            try:
+                self.get(name)
+                results[name] = None
+            except ModelUnavailableError as e:
+                results[name] = str(e)
+        return results
+
+    def unload(self, name):
+        """Drop the loaded instance so the next call reloads it."""
+        entry = self._entry(name)
+        with entry.lock:
+            entry.model = None
+            entry.load_seconds = None
+            entry.memory_bytes = None
+            entry.loaded_at = None
+
+    def stats(self):
+        """
+        Return load status, load time and memory delta per registered model.
+        """
+        return {
+            name: {
+                "path": entry.path,
+                "loaded": entry.model is not None,
+                "load_seconds": entry.load_seconds,
+                "memory_bytes": entry.memory_bytes,
+                "loaded_at": entry.loaded_at,
+                "error": entry.error,
+            }
+            for name, entry in list(self._entries.items())
+        }
+
+# ---------- SHARED INSTANCE ----------
+registry = ModelRegistry()
@@ -0,0 +1,156 @@
+"""
+AgriAssist AI - Prediction Cache
+Phase 2: Advisory Engine + Dashboard Integration
+
+Content-addressed cache for crop health predictions. Entries are keyed by a
+hash of the image bytes plus the model version, held in a size-bounded LRU,
+and optionally persisted to a SQLite file so they survive restarts.
+"""
+
+import json
+import time
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+
+# ---------- KEYS ----------
+def content_key(data: bytes, model_version: str) -> str:
+    """Return the cache key for raw image bytes under a given model version."""
+    return f"{model_version}:{hashlib.sha256(data).hexdigest()}"
+
+# ---------- CACHE ----------
+class PredictionCache:
+    """
+    Thread-safe LRU cache of prediction dicts with an optional disk tier.
+    """
+
+    def __init__(self, max_entries=1024, persist_path=None):
+        self.max_entries = max(int(max_entries), 0)
+        self.persist_path = persist_path or None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        self._puts = 0
+        self._reset_stats()
+        if self.persist_path:
+            self._open_store()
+
+    def _reset_stats(self):
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.saved_seconds = 0.0
+
+    def _open_store(self):
+        try:
+            self._conn = sqlite3.connect(self.persist_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS predictions ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "compute_seconds REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logging.error(f"Prediction cache store unavailable, using memory only: {e}")
+            self._conn = None
+
+    @property
+    def enabled(self):
+        return self.max_entries > 0
+
+    def _remember(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key):
+        """
+        Return a copy of the cached result for `key`, or None on a miss.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self.saved_seconds += entry[1]
+                return dict(entry[0])
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT value, compute_seconds FROM predictions WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    entry = (json.loads(row[0]), row[1])
+                    self._conn.execute(
+                        "UPDATE predictions SET accessed_at = ? WHERE key = ?", (time.time(), key)
+                    )
+                    self._conn.commit()
+                    self._remember(key, entry)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    self.saved_seconds += entry[1]
+                    return dict(entry[0])
+
+            self.misses += 1
+            return None
+
+    def put(self, key, result, compute_seconds=0.0):
+        """
+        Store `result` under `key`. `compute_seconds` is the cost of producing
+        it, credited to `saved_seconds` on every later hit.
+        """
+        if not self.enabled:
+            return
+        entry = (dict(result), float(compute_seconds))
+        with self._lock:
+            self._remember(key, entry)
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO predictions VALUES (?, ?, ?, ?)",
+                        (key, json.dumps(entry[0]), entry[1], time.time()),
+                    )
+                    self._puts += 1
+                    if self._puts % 100 == 0:
+                        # Keep the disk tier bounded too (10x the memory tier)
+                        self._conn.execute(
+                            "DELETE FROM predictions WHERE key NOT IN ("
+                            "SELECT key FROM predictions ORDER BY accessed_at DESC LIMIT ?)",
+                            (self.max_entries * 10,),
+                        )
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logging.error(f"Failed to persist prediction cache entry: {e}")
+
+    def clear(self):
+        """Drop all entries (memory and disk) and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM predictions")
+                self._conn.commit()
+            self._reset_stats()
+
+    def stats(self):
+        """Return hit/miss counters, hit rate and estimated model time saved."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "persistent": self._conn is not None,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "saved_seconds": round(self.saved_seconds, 3),
+            }
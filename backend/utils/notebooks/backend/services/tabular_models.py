@@ -0,0 +1,163 @@
+"""
+AgriAssist AI - Tabular Model Serving
+Phase 2: Advisory Engine + Dashboard Integration
+
+Serves the scikit-learn models shipped in models_store:
+- yield_model.pkl: [acreage, rainfall, nitrogen] -> yield
+- irrigation_model.pkl: [rainfall, temperature, humidity] -> irrigation needed (1/0)
+
+Each model is loaded once through the shared model registry, via
+artifact_store (digest-checked, weights memory-mapped). Feature rows
+(one dict or a list of dicts) are stacked into a single matrix so many farms
+are scored in one `predict` call; rows missing a feature get None. Latency
+is recorded per model.
+"""
+
+import os
+import time
+import threading
+import numpy as np
+from backend.services.model_registry import registry
+from backend.services.artifact_store import load_artifact
+
+# ---------- MODELS ----------
+YIELD_MODEL = "yield_model"
+IRRIGATION_MODEL = "irrigation_model"
+
+MODEL_FEATURES = {
+    YIELD_MODEL: ["acreage", "rainfall", "nitrogen"],
+    IRRIGATION_MODEL: ["rainfall", "temperature", "humidity"],
+}
+MODEL_PATHS = {
+    YIELD_MODEL: os.getenv("YIELD_MODEL_PATH", "models_store/yield_model.pkl"),
+    IRRIGATION_MODEL: os.getenv("IRRIGATION_MODEL_PATH", "models_store/irrigation_model.pkl"),
+}
+
+for _name, _path in MODEL_PATHS.items():
+    registry.register(_name, _path, load_artifact)
+
+# ---------- LATENCY ----------
+class _Latency:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.rows = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.last_seconds = 0.0
+
+    def record(self, rows, seconds):
+        with self._lock:
+            self.calls += 1
+            self.rows += rows
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+            self.last_seconds = seconds
+
+    def stats(self):
+        with self._lock:
+            calls = self.calls
+            return {
+                "calls": calls,
+                "rows": self.rows,
+                "mean_batch_size": self.rows / calls if calls else 0.0,
+                "mean_ms": 1000.0 * self.total_seconds / calls if calls else 0.0,
+                "max_ms": 1000.0 * self.max_seconds,
+                "last_ms": 1000.0 * self.last_seconds,
+                "mean_ms_per_row": 1000.0 * self.total_seconds / self.rows if self.rows else 0.0,
+            }
+
+_latency = {name: _Latency() for name in MODEL_FEATURES}
+
+# ---------- ERRORS ----------
+class FeatureValueError(ValueError):
+    """Raised when a feature value cannot be read as a number."""
+
+    def __init__(self, field, row):
+        super().__init__(f"Feature '{field}' must be a number (row {row}).")
+        self.field = field
+        self.row = row
+
+# ---------- PREDICTION ----------
+def feature_matrix(model_name, rows):
+    """
+    Stack feature dicts into an (n, k) float64 matrix in the model's
+    feature order. Returns the matrix and a mask of rows with every feature.
+    Raises FeatureValueError naming the first non-numeric value.
+    """
+    features = MODEL_FEATURES[model_name]
+    values = [[row.get(f) if row.get(f) is not None else np.nan for f in features] for row in rows]
+    try:
+        matrix = np.array(values, dtype=np.float64).reshape(len(rows), len(features))
+    except (TypeError, ValueError):
+        for i, row_values in enumerate(values):
+            for field, value in zip(features, row_values):
+                try:
+                    float(value)
+                except (TypeError, ValueError):
+                    raise FeatureValueError(field, i)
+        raise
+    complete = ~np.isnan(matrix).any(axis=1)
+    return matrix, complete
+
+def predict(model_name, rows):
+    """
+    Score one feature dict or a list of them with a single model.predict
+    call. Returns a float (or None) for a dict, else a list aligned with
+    `rows`. Raises ModelUnavailableError if the model cannot be loaded.
+    """
+    single = isinstance(rows, dict)
+    rows = [rows] if single else list(rows)
+    matrix, complete = feature_matrix(model_name, rows)
+    model = registry.get(model_name)
+
+    out = [None] * len(rows)
+    if complete.any():
+        start = time.perf_counter()
+        preds = np.asarray(model.predict(matrix[complete]), dtype=np.float64).reshape(-1)
+        _latency[model_name].record(int(complete.sum()), time.perf_counter() - start)
+        for i, value in zip(np.flatnonzero(complete), preds.tolist()):
+            out[i] = value
+    return out[0] if single else out
+
+def predict_yield(rows):
+    """Predicted yield per feature row (acreage, rainfall, nitrogen)."""
+    return predict(YIELD_MODEL, rows)
+
+def predict_irrigation(rows):
+    """1 if irrigation is needed, 0 if not, per feature row (rainfall, temperature, humidity)."""
+    preds = predict(IRRIGATION_MODEL, rows)
+    if isinstance(preds, list):
+        return [None if p is None else int(round(p)) for p in preds]
+    return None if preds is None else int(round(preds))
+
+# ---------- FARM FEATURES ----------
+def farm_features(farm, weather_data=None, soil_data=None):
+    """Merge the farm's acreage with weather and soil readings into one feature dict."""
+    row = {"acreage": farm.acreage}
+    row.update(weather_data or {})
+    row.update(soil_data or {})
+    return row
+
+def forecast_farms(farms, weather=None, soil=None):
+    """
+    Yield and irrigation predictions for many farms, one predict call per
+    model. `weather`/`soil` are lists of reading dicts aligned with `farms`.
+    Returns (yields, irrigation) lists aligned with `farms`.
+    """
+    weather = weather or [None] * len(farms)
+    soil = soil or [None] * len(farms)
+    rows = [farm_features(f, w, s) for f, w, s in zip(farms, weather, soil)]
+    return predict_yield(rows), predict_irrigation(rows)
+
+# ---------- METRICS ----------
+def stats():
+    """Per-model latency and batch-size counters."""
+    return {name: latency.stats() for name, latency in _latency.items()}
+
+def reset_stats():
+    for latency in _latency.values():
+        latency.reset()
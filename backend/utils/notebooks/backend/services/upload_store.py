@@ -0,0 +1,144 @@
+"""
+AgriAssist AI - Upload Store Service
+Phase 2: Advisory Engine + Dashboard Integration
+
+Persists uploaded crop images to UPLOAD_DIR under content-addressed names
+(sha256 of the bytes plus the original extension), so identical photos are
+stored once and different farmers' IMG_0001.jpg never overwrite each other.
+Uploads are streamed to disk in fixed-size chunks with a hard size limit.
+"""
+
+import os
+import hashlib
+import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from backend.utils.file_paths import UPLOAD_DIR, get_upload_path, ensure_directories
+
+# ---------- CONFIG ----------
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", 10 * 1024 * 1024))
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", 64 * 1024))
+ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+
+# ---------- ERRORS ----------
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds UPLOAD_MAX_BYTES."""
+
+class UnsupportedUploadError(ValueError):
+    """Raised when an upload does not have an allowed image extension."""
+
+# ---------- NAMING ----------
+def upload_extension(filename: str) -> str:
+    """Return the lower-cased extension of `filename` if it is an allowed image type."""
+    ext = os.path.splitext(filename or "")[1].lower()
+    if ext not in ALLOWED_EXTENSIONS:
+        raise UnsupportedUploadError(
+            f"Unsupported image type '{ext or filename}'. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}."
+        )
+    return ext
+
+def content_file_name(digest: str, ext: str) -> str:
+    """Content-addressed file name for an image digest."""
+    return f"{digest}{ext}"
+
+def upload_name(data: bytes, filename: str) -> str:
+    """Content-addressed file name for in-memory image bytes."""
+    return content_file_name(hashlib.sha256(data).hexdigest(), upload_extension(filename))
+
+# ---------- STREAMING STORE ----------
+def store_stream(stream, filename, max_bytes=None, chunk_size=None):
+    """
+    Copy `stream` to the upload folder in chunks, hashing as it goes.
+    Stops and discards the partial file as soon as `max_bytes` is exceeded.
+    Returns a dict with file_name, sha256, size and whether the image
+    was already stored (deduplicated).
+    """
+    ext = upload_extension(filename)
+    max_bytes = UPLOAD_MAX_BYTES if max_bytes is None else max_bytes
+    chunk_size = chunk_size or UPLOAD_CHUNK_SIZE
+    ensure_directories()
+
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=UPLOAD_DIR, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(f"Image exceeds the {max_bytes} byte upload limit.")
+                digest.update(chunk)
+                out.write(chunk)
+        return _commit(tmp_path, digest.hexdigest(), ext, size)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _commit(tmp_path, hexdigest, ext, size):
+    file_name = content_file_name(hexdigest, ext)
+    path = get_upload_path(file_name)
+    deduplicated = os.path.exists(path)
+    if not deduplicated:
+        os.replace(tmp_path, path)
+    return {"file_name": file_name, "sha256": hexdigest, "size": size, "deduplicated": deduplicated}
+
+def read_limited(stream, max_bytes=None, chunk_size=None) -> bytes:
+    """
+    Read `stream` into memory in chunks, raising UploadTooLargeError once
+    `max_bytes` is exceeded instead of buffering an unbounded body.
+    """
+    max_bytes = UPLOAD_MAX_BYTES if max_bytes is None else max_bytes
+    chunk_size = chunk_size or UPLOAD_CHUNK_SIZE
+    chunks = []
+    size = 0
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_bytes:
+            raise UploadTooLargeError(f"Image exceeds the {max_bytes} byte upload limit.")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+def save_upload(data: bytes, filename: str) -> dict:
+    """
+    Write in-memory image bytes under their content-addressed name.
+    Already stored images are not rewritten.
+    """
+    ext = upload_extension(filename)
+    hexdigest = hashlib.sha256(data).hexdigest()
+    file_name = content_file_name(hexdigest, ext)
+    if os.path.exists(get_upload_path(file_name)):
+        return {"file_name": file_name, "sha256": hexdigest, "size": len(data), "deduplicated": True}
+
+    ensure_directories()
+    fd, tmp_path = tempfile.mkstemp(dir=UPLOAD_DIR, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(data)
+        return _commit(tmp_path, hexdigest, ext, len(data))
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+# ---------- BACKGROUND WRITER ----------
+UPLOAD_WRITERS = int(os.getenv("UPLOAD_WRITERS", 2))
+_writer = ThreadPoolExecutor(max_workers=UPLOAD_WRITERS, thread_name_prefix="upload-writer")
+
+def _save_logged(data, filename):
+    try:
+        return save_upload(data, filename)
+    except OSError as e:
+        logging.error(f"Failed to persist upload {filename}: {e}")
+        raise
+
+def save_upload_async(data: bytes, filename: str):
+    """
+    Persist the image off the request path. Returns a Future of the
+    save_upload result.
+    """
+    return _writer.submit(_save_logged, data, filename)
@@ -0,0 +1,88 @@
+"""
+AgriAssist AI - Dataset Reader Utility
+Phase 2: Advisory Engine + Dashboard Integration
+
+Reads datasets written by the Phase 1 preprocessing step. When a typed
+columnar copy (.parquet or .feather) sits next to the CSV and is at least as
+new, it is loaded instead, so dtypes and dates are not re-inferred. Column
+projection loads only the columns a caller needs.
+
+Preprocessing writes its columnar files for the cleaned outputs
+(X_clean.parquet for X.csv) to PREPROCESSED_DIR, the repository-level
+datasets/ folder by default. Callers that can work on cleaned rows pass
+cleaned=True to read those in place of the raw CSV.
+"""
+
+import os
+import logging
+import pandas as pd
+
+# ---------- CONFIG ----------
+COLUMNAR_EXTENSIONS = (".parquet", ".feather")
+CATEGORICAL_COLUMNS = ["crop", "soil_type"]
+# data_preprocessing.OUTPUT_DIR (same PREPROCESSED_DIR override)
+PREPROCESSED_DIR = os.getenv(
+    "PREPROCESSED_DIR",
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../../datasets")),
+)
+
+# ---------- HELPERS ----------
+def columnar_path(csv_path, cleaned=False):
+    """
+    Return the columnar sibling of `csv_path` if it exists and is not older
+    than the CSV, else None. With `cleaned`, the preprocessing output for a
+    raw CSV (X.csv -> X_clean.parquet/.feather, next to the CSV or in
+    PREPROCESSED_DIR) also qualifies.
+    """
+    stem = os.path.splitext(csv_path)[0]
+    stems = [stem]
+    if cleaned and not stem.endswith("_clean"):
+        stems.append(f"{stem}_clean")
+        stems.append(os.path.join(PREPROCESSED_DIR, f"{os.path.basename(stem)}_clean"))
+    csv_mtime = os.path.getmtime(csv_path) if os.path.exists(csv_path) else 0
+    for candidate in stems:
+        for ext in COLUMNAR_EXTENSIONS:
+            path = candidate + ext
+            if os.path.exists(path) and os.path.getmtime(path) >= csv_mtime:
+                return path
+    return None
+
+def _columnar_schema(path):
+    """Column names stored in a Parquet or Feather file."""
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        return pq.read_schema(path).names
+    import pyarrow.ipc as ipc
+    with ipc.open_file(path) as reader:
+        return reader.schema.names
+
+# ---------- READER ----------
+def read_columnar(path, columns=None):
+    """Load a Parquet or Feather file, reading only `columns` that exist."""
+    if columns is not None:
+        available = set(_columnar_schema(path))
+        columns = [c for c in columns if c in available]
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_feather(path, columns=columns)
+
+def read_table(csv_path, columns=None, cleaned=False):
+    """
+    Load a dataset, preferring its columnar copy (or, with `cleaned`, the
+    preprocessed copy of a raw CSV). `columns` limits the columns read
+    (missing ones are ignored). The CSV fallback reads crop and soil_type as
+    categoricals, matching the columnar files.
+    """
+    path = columnar_path(csv_path, cleaned)
+    if path is not None:
+        try:
+            return read_columnar(path, columns)
+        except (ImportError, OSError, ValueError) as e:
+            logging.warning(f"Could not read {path}, falling back to CSV: {e}")
+
+    usecols = None
+    if columns is not None:
+        wanted = set(columns)
+        usecols = lambda c: c in wanted
+    dtype = {c: "category" for c in CATEGORICAL_COLUMNS}
+    return pd.read_csv(csv_path, usecols=usecols, dtype=dtype)
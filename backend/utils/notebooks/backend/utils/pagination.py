@@ -0,0 +1,100 @@
+"""
+AgriAssist AI - Pagination Utility
+Phase 2: Advisory Engine + Dashboard Integration
+
+Keyset (cursor) pagination helpers for list endpoints. A page is fetched
+with `WHERE key > last_key ORDER BY key LIMIT n + 1`, an index range scan
+whose cost does not grow with the page number, unlike OFFSET. Cursors are
+opaque url-safe strings encoding the last row's key values.
+"""
+
+import os
+import json
+import base64
+
+# ---------- CONFIG ----------
+DEFAULT_LIMIT = int(os.getenv("PAGE_SIZE_DEFAULT", 50))
+MAX_LIMIT = int(os.getenv("PAGE_SIZE_MAX", 500))
+
+# ---------- ERRORS ----------
+class PaginationError(ValueError):
+    """Raised for an invalid limit, cursor or field list."""
+
+# ---------- PARAMETERS ----------
+def parse_limit(value, default=DEFAULT_LIMIT, maximum=MAX_LIMIT):
+    """Page size from a query string value, capped at `maximum`."""
+    if value in (None, ""):
+        return default
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise PaginationError("limit must be an integer.")
+    if limit < 1:
+        raise PaginationError("limit must be at least 1.")
+    return min(limit, maximum)
+
+def encode_cursor(*values):
+    """Opaque cursor for the key values of the last row on a page."""
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor, size):
+    """Key values from a cursor made by encode_cursor with `size` values."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise PaginationError("Invalid cursor.")
+    if not isinstance(values, list) or len(values) != size:
+        raise PaginationError("Invalid cursor.")
+    return values
+
+def parse_fields(value, allowed, required=("id",)):
+    """
+    Column names requested through `fields=a,b,c`, in `allowed` order, always
+    including `required`. All allowed fields when the parameter is absent.
+    """
+    if not value:
+        return list(allowed)
+    requested = {f.strip() for f in value.split(",") if f.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise PaginationError(f"Unknown fields: {', '.join(sorted(unknown))}.")
+    requested.update(required)
+    return [f for f in allowed if f in requested]
+
+# ---------- QUERIES ----------
+def fetch_page(query, limit):
+    """Run an ordered query for one page. Returns (rows, has_more)."""
+    rows = query.limit(limit + 1).all()
+    return rows[:limit], len(rows) > limit
+
+def keyset_list(session, model, args, filters=(), default_limit=DEFAULT_LIMIT, fields=None):
+    """
+    One page of `model` rows ordered by id, as plain dicts.
+    `args` is the request query string: limit, cursor, fields, plus one
+    equality filter per name in `filters`. `fields` limits the selectable
+    columns (all table columns by default). Only the selected columns are
+    queried, so no ORM instances are built.
+    Returns (items, next_cursor); next_cursor is None on the last page.
+    """
+    allowed = list(fields or [c.name for c in model.__table__.columns])
+    fields = parse_fields(args.get("fields"), allowed)
+    limit = parse_limit(args.get("limit"), default_limit)
+
+    query = session.query(*[getattr(model, f) for f in fields])
+    for name in filters:
+        value = args.get(name)
+        if value:
+            query = query.filter(getattr(model, name) == value)
+    cursor = args.get("cursor")
+    if cursor:
+        after = decode_cursor(cursor, 1)[0]
+        if not isinstance(after, int):
+            raise PaginationError("Invalid cursor.")
+        query = query.filter(model.id > after)
+
+    rows, has_more = fetch_page(query.order_by(model.id), limit)
+    items = [dict(zip(fields, row)) for row in rows]
+    next_cursor = encode_cursor(items[-1]["id"]) if has_more else None
+    return items, next_cursor
@@ -0,0 +1,209 @@
+"""
+AgriAssist AI - Serialization Utility
+Phase 2: Advisory Engine + Dashboard Integration
+
+Fast JSON responses for the API:
+- per-model serializers built once from the table columns, reading loaded
+  values from instance state instead of reflecting over __table__ per row,
+- orjson for encoding when installed (JSON_ENCODER=json forces the stdlib),
+- gzip/brotli compression of responses above COMPRESS_MIN_BYTES, chosen
+  from Accept-Encoding (brotli only when the brotli package is installed).
+
+Benchmark bytes and CPU per large list response (from the backend parent folder):
+    python -m backend.utils.serialization --rows 10000
+"""
+
+import os
+import gzip
+import json
+import time
+import argparse
+import operator
+from datetime import date, datetime
+from flask import Response, request
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# ---------- CONFIG ----------
+JSON_ENCODER = os.getenv("JSON_ENCODER", "orjson" if orjson else "json").lower()
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", 1024))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", 6))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", 5))
+COMPRESSIBLE_MIMETYPES = {"application/json", "application/x-ndjson", "text/plain", "text/html", "text/csv"}
+
+# ---------- MODEL SERIALIZERS ----------
+_serializers = {}
+
+def serializer_for(model, fields=None):
+    """
+    Return a function mapping a `model` instance to a dict of `fields`
+    (all table columns by default). Built once per model and field list.
+    """
+    key = (model, tuple(fields) if fields else None)
+    serializer = _serializers.get(key)
+    if serializer is None:
+        names = tuple(fields or (c.key for c in model.__table__.columns))
+        getter = operator.attrgetter(*names)
+        slow = (lambda obj: {names[0]: getter(obj)}) if len(names) == 1 else \
+               (lambda obj: dict(zip(names, getter(obj))))
+
+        def serializer(obj):
+            # Loaded column values sit in the instance __dict__; reading them
+            # there skips the ORM descriptors. Expired/deferred columns go
+            # through the descriptors so they load as usual.
+            state = obj.__dict__
+            try:
+                return {name: state[name] for name in names}
+            except KeyError:
+                return slow(obj)
+        _serializers[key] = serializer
+    return serializer
+
+def serialize_all(objs, fields=None):
+    """Serialize a list of same-model instances with one compiled serializer."""
+    if not objs:
+        return []
+    serializer = serializer_for(type(objs[0]), fields)
+    return [serializer(obj) for obj in objs]
+
+# ---------- JSON ----------
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dumps(payload, encoder=None) -> bytes:
+    """
+    Encode `payload` as compact UTF-8 JSON. Datetimes become ISO 8601 with
+    either encoder.
+    """
+    if (encoder or JSON_ENCODER) == "orjson" and orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=_default).encode()
+
+def json_response(payload, status=200):
+    """Flask response with `payload` encoded by `dumps`."""
+    return Response(dumps(payload), status=status, mimetype="application/json")
+
+# ---------- COMPRESSION ----------
+def choose_encoding(accept_encodings):
+    """Best supported content coding from a parsed Accept-Encoding header."""
+    if brotli is not None and accept_encodings["br"]:
+        return "br"
+    if accept_encodings["gzip"]:
+        return "gzip"
+    return None
+
+def compress(data: bytes, encoding) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL)
+
+def compress_response(response):
+    """
+    after_request hook: compress eligible responses for clients that accept
+    it. Streaming responses, small bodies and non-text types are left alone.
+    """
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+    response.vary.add("Accept-Encoding")
+    encoding = choose_encoding(request.accept_encodings)
+    if encoding is None:
+        return response
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_BYTES:
+        return response
+
+    response.set_data(compress(data, encoding))
+    response.headers["Content-Encoding"] = encoding
+    # The compressed body is a different representation: keep validators weak
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+# ---------- BENCHMARK ----------
+def _synthetic_profiles(n):
+    from backend.models import FarmProfile
+    crops = ["Wheat", "Rice", "Maize", "Cotton"]
+    regions = ["Haryana", "Punjab", "Bihar", "Maharashtra"]
+    return [
+        FarmProfile(id=i, farmer_name=f"Farmer {i}", crop_type=crops[i % 4], acreage=1.5 + i % 40,
+                    planting_date="2026-01-15", soil_type="Loamy", region=regions[i % 4],
+                    version=1, updated_at=datetime(2026, 1, 15, 8, 30))
+        for i in range(1, n + 1)
+    ]
+
+def _cpu_ms(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        result = fn()
+        best = min(best, time.process_time() - start)
+    return result, round(best * 1000, 2)
+
+def _handwritten_dict(p):
+    # The previous FarmProfile.to_dict override
+    return {
+        "id": p.id,
+        "farmer_name": p.farmer_name,
+        "crop_type": p.crop_type,
+        "acreage": p.acreage,
+        "planting_date": p.planting_date,
+        "soil_type": p.soil_type,
+        "region": p.region,
+    }
+
+def benchmark(rows=10000, repeat=5):
+    """
+    CPU time (best of `repeat`) and bytes for one list response of `rows`
+    farm profiles: the previous jsonify([p.to_dict() ...]) path vs compiled
+    serializers with json_response, per encoder, and identity vs gzip vs
+    brotli body size.
+    """
+    from flask import Flask, jsonify
+    from backend.models import FarmProfile
+    profiles = _synthetic_profiles(rows)
+    fields = FarmProfile.SERIALIZED_FIELDS
+
+    _, report_handwritten = _cpu_ms(lambda: [_handwritten_dict(p) for p in profiles], repeat)
+    _, report_compiled = _cpu_ms(lambda: serialize_all(profiles, fields), repeat)
+    report = {"rows": rows, "to_dict_ms": {"handwritten": report_handwritten, "compiled": report_compiled}}
+
+    with Flask(__name__).app_context():
+        baseline, ms = _cpu_ms(lambda: jsonify({"profiles": [_handwritten_dict(p) for p in profiles]}).get_data(),
+                               repeat)
+    response = {"jsonify": {"ms": ms, "bytes": len(baseline)}}
+    body = None
+    for encoder in ("json", "orjson"):
+        if encoder == "orjson" and orjson is None:
+            continue
+        body, ms = _cpu_ms(lambda: dumps({"profiles": serialize_all(profiles, fields)}, encoder), repeat)
+        response[f"json_response ({encoder})"] = {"ms": ms, "bytes": len(body)}
+    report["response"] = response
+
+    sizes = {"identity": {"bytes": len(body), "ms": 0.0}}
+    for encoding in ("gzip", "br"):
+        if encoding == "br" and brotli is None:
+            continue
+        compressed, ms = _cpu_ms(lambda: compress(body, encoding), repeat)
+        sizes[encoding] = {"bytes": len(compressed), "ms": ms}
+    report["compression"] = sizes
+    return report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization and compression.")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(benchmark(args.rows, args.repeat), indent=2))
@@ -3,10 +3,33 @@ AgriAssist AI - Input Validators
 Phase 2: Advisory Engine + Dashboard Integration
 
 Reusable validation functions for API inputs.
+
+Each scalar validator has a batch counterpart taking a DataFrame or a list
+of records and returning one error list per row, identical to what the
+scalar validator returns for that row. Batch checks run as column-wise
+pandas/NumPy operations on the common value types (strings, numbers, None);
+any other value falls back to the scalar rule, once per distinct value.
 """
 
 import re
 from datetime import datetime
+import numpy as np
+import pandas as pd
+
+# Row result where the scalar validator raises TypeError on a field's type
+INVALID_TYPES_ERROR = "Invalid field types."
+
+FILE_NAME_PATTERN = re.compile(r"^[\w,\s-]+\.[A-Za-z]{3,4}$")
+# datetime.strptime's own grammar for "%Y-%m-%d", limited to ASCII digits
+DATE_PATTERN = re.compile(r"\A(\d{4})-(1[0-2]|0[1-9]|[1-9])-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])\Z", re.ASCII)
+# Plain decimal literals, which float() and pd.to_numeric read alike
+DECIMAL_PATTERN = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?", re.ASCII)
+
+_NUMBER_TYPES = (bool, int, float, np.bool_, np.int32, np.int64, np.float32, np.float64)
+_DAYS_IN_MONTH = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+# Per-field result codes used by the batch validators
+_OK, _REQUIRED, _NOT_POSITIVE, _NOT_A_NUMBER, _BAD_FORMAT, _INVALID_TYPE = range(6)
 
 # ---------- FARM PROFILE VALIDATION ----------
 def validate_farm_profile(data: dict):
@@ -24,7 +47,7 @@ def validate_farm_profile(data: dict):
         acreage = float(data.get("acreage", 0))
         if acreage <= 0:
             errors.append("Acreage must be greater than zero.")
-    except ValueError:
+    except (ValueError, OverflowError):
         errors.append("Acreage must be a number.")
 
     # Validate planting date format (YYYY-MM-DD)
@@ -65,6 +88,230 @@ def validate_crop_health_upload(data: dict):
         errors.append("File name is required.")
     else:
         # Basic file name check
-        if not re.match(r"^[\w,\s-]+\.[A-Za-z]{3,4}$", data["file_name"]):
+        if not FILE_NAME_PATTERN.match(data["file_name"]):
             errors.append("Invalid file name format.")
     return errors
+
+# ---------- BATCH HELPERS ----------
+def _column(data, field):
+    """
+    (values, present) for one field of a DataFrame or list of records:
+    an object array of values (None where absent) and a bool array marking
+    rows that have the key/column.
+    """
+    if isinstance(data, pd.DataFrame):
+        n = len(data)
+        if field not in data.columns:
+            return np.full(n, None, dtype=object), np.zeros(n, dtype=bool)
+        return data[field].to_numpy(dtype=object), np.ones(n, dtype=bool)
+    values = pd.Series([record.get(field) for record in data], dtype=object).to_numpy()
+    present = np.fromiter((field in record for record in data), dtype=bool, count=len(data))
+    return values, present
+
+def _types(values):
+    return pd.Series(values, dtype=object).map(type)
+
+def _per_distinct(strings, check):
+    """
+    Run a vectorized `check` over the distinct values of an object array of
+    strings and spread its codes back to every row. Bulk imports repeat
+    acreages and planting dates heavily, so this is usually far fewer values.
+    """
+    codes, uniques = pd.factorize(strings)
+    return check(uniques)[codes]
+
+def _falsy(values, types):
+    """Vectorized `not value`."""
+    falsy = np.zeros(len(values), dtype=bool)
+    is_str = (types == str).to_numpy()
+    is_none = (types == type(None)).to_numpy()
+    falsy[is_str] = values[is_str] == ""
+    falsy[is_none] = True
+    other = ~(is_str | is_none)
+    if other.any():
+        falsy[other] = [not value for value in values[other]]
+    return falsy
+
+def _required(values, types):
+    return np.where(_falsy(values, types), _REQUIRED, _OK).astype(np.int8)
+
+def _acreage_rule(value):
+    try:
+        return _NOT_POSITIVE if float(value) <= 0 else _OK
+    except (ValueError, OverflowError):
+        return _NOT_A_NUMBER
+    except TypeError:
+        return _INVALID_TYPE
+
+def _acreage_string_codes(strings):
+    series = pd.Series(strings, dtype=object)
+    numbers = pd.to_numeric(series.where(series.str.fullmatch(DECIMAL_PATTERN)), errors="coerce")
+    numbers = numbers.to_numpy(dtype=np.float64)
+    codes = np.where(numbers <= 0, _NOT_POSITIVE, _OK).astype(np.int8)
+    # Non-decimal spellings, non-finite values and values near zero take
+    # float() itself, so underflow and special values agree exactly
+    slow = ~np.isfinite(numbers) | (np.abs(numbers) < 1e-300)
+    if slow.any():
+        codes[slow] = [_acreage_rule(value) for value in strings[slow]]
+    return codes
+
+def _acreage_codes(values, present, types):
+    """Vectorized `float(value) <= 0` with the scalar validator's error handling."""
+    codes = np.full(len(values), _OK, dtype=np.int8)
+    codes[~present] = _NOT_POSITIVE  # a missing key defaults to 0
+    is_str = present & (types == str).to_numpy()
+    is_number = present & types.isin(_NUMBER_TYPES).to_numpy() & ~is_str
+    rest = present & ~is_str & ~is_number
+
+    if is_number.any():
+        try:
+            numbers = values[is_number].astype(np.float64)
+            codes[is_number] = np.where(numbers <= 0, _NOT_POSITIVE, _OK)
+        except OverflowError:  # ints beyond float range
+            rest |= is_number
+
+    if is_str.any():
+        codes[is_str] = _per_distinct(values[is_str], _acreage_string_codes)
+
+    if rest.any():
+        codes[rest] = [_acreage_rule(value) for value in values[rest]]
+    return codes
+
+def _date_rule(value):
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+        return _OK
+    except ValueError:
+        return _BAD_FORMAT
+    except TypeError:
+        return _INVALID_TYPE
+
+def _date_string_codes(strings):
+    parts = pd.Series(strings, dtype=object).str.extract(DATE_PATTERN)
+    matched = parts[0].notna().to_numpy()
+    codes = np.full(len(strings), _BAD_FORMAT, dtype=np.int8)
+    if matched.any():
+        parts = parts[matched]
+        year = parts[0].astype(np.int64).to_numpy()
+        month = parts[1].astype(np.int64).to_numpy()
+        day = parts[2].str.strip().astype(np.int64).to_numpy()
+        leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+        last_day = _DAYS_IN_MONTH[month] + ((month == 2) & leap)
+        codes[matched] = np.where((year >= 1) & (day <= last_day), _OK, _BAD_FORMAT)
+    # strptime also reads non-ASCII digits; let it decide the rest
+    unmatched = ~matched
+    if unmatched.any():
+        codes[unmatched] = [_date_rule(value) for value in strings[unmatched]]
+    return codes
+
+def _date_codes(values, types):
+    """Vectorized `datetime.strptime(value, "%Y-%m-%d")` for truthy values."""
+    codes = _required(values, types)
+    is_str = (codes == _OK) & (types == str).to_numpy()
+    rest = (codes == _OK) & ~is_str
+
+    if is_str.any():
+        codes[is_str] = _per_distinct(values[is_str], _date_string_codes)
+
+    if rest.any():
+        codes[rest] = [_date_rule(value) for value in values[rest]]
+    return codes
+
+def _file_name_rule(value):
+    try:
+        return _OK if FILE_NAME_PATTERN.match(value) else _BAD_FORMAT
+    except TypeError:
+        return _INVALID_TYPE
+
+def _error_lists(code_columns, messages):
+    """
+    Turn per-field code arrays into per-row error lists. `messages` maps
+    (field index, code) to an error message. A row with an _INVALID_TYPE code
+    gets [INVALID_TYPES_ERROR] alone, as the scalar validator raises there.
+    """
+    # One integer per row combining its field codes, built into a list once
+    combined = np.zeros(len(code_columns[0]), dtype=np.int64)
+    for column in code_columns:
+        combined = combined * 8 + column
+    keys, inverse = np.unique(combined, return_inverse=True)
+    built = []
+    for key in keys.tolist():
+        row = []
+        for _ in code_columns:
+            key, code = divmod(key, 8)
+            row.append(code)
+        row.reverse()
+        if _INVALID_TYPE in row:
+            built.append([INVALID_TYPES_ERROR])
+        else:
+            built.append([messages[(i, code)] for i, code in enumerate(row) if code != _OK])
+    return [list(built[k]) for k in inverse.ravel().tolist()]
+
+# ---------- BATCH VALIDATION ----------
+_FARM_PROFILE_MESSAGES = {
+    (0, _REQUIRED): "Farmer name is required.",
+    (1, _REQUIRED): "Crop type is required.",
+    (2, _NOT_POSITIVE): "Acreage must be greater than zero.",
+    (2, _NOT_A_NUMBER): "Acreage must be a number.",
+    (3, _REQUIRED): "Planting date is required.",
+    (3, _BAD_FORMAT): "Planting date must be in YYYY-MM-DD format.",
+}
+
+def validate_farm_profiles(data):
+    """
+    Validate many farm profiles at once. `data` is a DataFrame or a list of
+    record dicts. Returns one error list per row, equal to
+    validate_farm_profile(row); rows where that raises TypeError on a field's
+    type get [INVALID_TYPES_ERROR].
+    """
+    farmer_name, _ = _column(data, "farmer_name")
+    crop_type, _ = _column(data, "crop_type")
+    acreage, acreage_present = _column(data, "acreage")
+    planting_date, _ = _column(data, "planting_date")
+    if not len(farmer_name):
+        return []
+    return _error_lists([
+        _required(farmer_name, _types(farmer_name)),
+        _required(crop_type, _types(crop_type)),
+        _acreage_codes(acreage, acreage_present, _types(acreage)),
+        _date_codes(planting_date, _types(planting_date)),
+    ], _FARM_PROFILE_MESSAGES)
+
+_ADVISORY_MESSAGES = {
+    (0, _REQUIRED): "Advisory type is required.",
+    (1, _REQUIRED): "Advisory message is required.",
+}
+
+def validate_advisories(data):
+    """Batch validate_advisory over a DataFrame or list of records."""
+    advisory_type, _ = _column(data, "advisory_type")
+    message, _ = _column(data, "message")
+    if not len(advisory_type):
+        return []
+    return _error_lists([
+        _required(advisory_type, _types(advisory_type)),
+        _required(message, _types(message)),
+    ], _ADVISORY_MESSAGES)
+
+_CROP_HEALTH_MESSAGES = {
+    (0, _REQUIRED): "Farm ID is required.",
+    (1, _REQUIRED): "File name is required.",
+    (1, _BAD_FORMAT): "Invalid file name format.",
+}
+
+def validate_crop_health_uploads(data):
+    """Batch validate_crop_health_upload over a DataFrame or list of records."""
+    farm_id, _ = _column(data, "farm_id")
+    file_name, _ = _column(data, "file_name")
+    if not len(farm_id):
+        return []
+    types = _types(file_name)
+    file_codes = _required(file_name, types)
+    is_str = (file_codes == _OK) & (types == str).to_numpy()
+    rest = (file_codes == _OK) & ~is_str
+    if is_str.any():
+        matched = pd.Series(file_name[is_str], dtype=object).str.match(FILE_NAME_PATTERN).to_numpy(dtype=bool)
+        file_codes[is_str] = np.where(matched, _OK, _BAD_FORMAT)
+    if rest.any():
+        file_codes[rest] = [_file_name_rule(value) for value in file_name[rest]]
+    return _error_lists([_required(farm_id, _types(farm_id)), file_codes], _CROP_HEALTH_MESSAGES)
@@ -5,15 +5,15 @@ This script inspects crop disease dataset using pandas for efficiency.
 """
 
 import os
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from backend.utils.dataset_io import read_table
 
 # ---------- LOAD DATA ----------
 DATA_PATH = os.path.join(os.path.dirname(__file__), "../datasets/crop_health.csv")
 
 # Expect columns: image_id, file_path, class, width, height, (optional: avg_intensity)
-df = pd.read_csv(DATA_PATH)
+df = read_table(DATA_PATH)  # prefers a typed .parquet/.feather copy
 
 # ---------- BASIC INFO ----------
 print("Dataset Shape:", df.shape)
@@ -8,10 +8,11 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+from backend.utils.dataset_io import read_table
 
 # ---------- LOAD DATA ----------
 DATA_PATH = os.path.join(os.path.dirname(__file__), "../datasets/market_prices.csv")
-df = pd.read_csv(DATA_PATH)
+df = read_table(DATA_PATH, cleaned=True)  # prefers the typed preprocessed copy
 
 # ---------- BASIC INFO ----------
 print("Dataset Shape:", df.shape)
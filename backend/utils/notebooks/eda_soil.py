@@ -4,14 +4,14 @@ Exploratory Data Analysis (EDA) - Soil Dataset
 This script loads, cleans, and visualizes soil data.
 """
 
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+from backend.utils.dataset_io import read_table
 
 # ---------- LOAD DATA ----------
 DATA_PATH = os.path.join(os.path.dirname(__file__), "../datasets/soil.csv")
-df = pd.read_csv(DATA_PATH)
+df = read_table(DATA_PATH, cleaned=True)  # prefers the typed preprocessed copy
 
 # ---------- BASIC INFO ----------
 print("Dataset Shape:", df.shape)
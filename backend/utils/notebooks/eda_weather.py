@@ -8,10 +8,12 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+from backend.utils.dataset_io import read_table
 
 # ---------- LOAD DATA ----------
 DATA_PATH = os.path.join(os.path.dirname(__file__), "../datasets/weather.csv")
-df = pd.read_csv(DATA_PATH)
+# Raw units: weather_clean is standardized, so only a raw columnar copy is used
+df = read_table(DATA_PATH)
 
 # ---------- BASIC INFO ----------
 print("Dataset Shape:", df.shape)
@@ -6,12 +6,98 @@ This script initializes or updates the database schema using SQLAlchemy models.
 """
 
 import logging
+from datetime import datetime
+from sqlalchemy import inspect, text
 from backend.app import create_app
 from backend.db import db
 from backend.models import FarmProfile, AdvisoryLog
 
+# Message format of upload rows before advisory_logs.file_name existed
+UPLOAD_LOG_PREFIX = "Image uploaded: "
+UPLOAD_LOG_SEPARATOR = "; "
+
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
+# SQLAlchemy stores SQLite DATETIMEs as text with microseconds. Values
+# written any other way (CURRENT_TIMESTAMP has no fraction) compare wrongly
+# against bound datetimes within the same second and break keyset cursors.
+SQLITE_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%f000"  # strftime's %f is SS.SSS
+EPOCH = "1970-01-01 00:00:00.000000"
+TIMESTAMP_COLUMNS = (("advisory_logs", "created_at"), ("farm_profiles", "updated_at"))
+
+def ensure_columns():
+    """
+    Add columns introduced after a table was first created.
+    SQLite cannot ADD COLUMN with a CURRENT_TIMESTAMP default, so timestamp
+    columns are added NOT NULL with a constant default and existing rows are
+    backfilled with the migration time, bound through the column type.
+    """
+    added = {
+        "advisory_logs": [("created_at", f"DATETIME NOT NULL DEFAULT '{EPOCH}'"),
+                          ("file_name", "VARCHAR(255)")],
+        "farm_profiles": [("version", "INTEGER NOT NULL DEFAULT 1"),
+                          ("updated_at", f"DATETIME NOT NULL DEFAULT '{EPOCH}'")],
+    }
+    tables = {model.__tablename__: model.__table__ for model in (FarmProfile, AdvisoryLog)}
+    inspector = inspect(db.engine)
+    for table, new_columns in added.items():
+        existing = {c["name"] for c in inspector.get_columns(table)}
+        for name, ddl in new_columns:
+            if name in existing:
+                continue
+            with db.engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+                if ddl.startswith("DATETIME"):
+                    conn.execute(tables[table].update().values({name: datetime.utcnow()}))
+                elif (table, name) == ("advisory_logs", "file_name"):
+                    backfill_upload_names(conn)
+            logging.info(f"Added {table}.{name}")
+
+def backfill_upload_names(conn):
+    """
+    Fill advisory_logs.file_name for crop_health rows written before the
+    column existed, from their "Image uploaded: <file>[; ...]" message.
+    """
+    logs = AdvisoryLog.__table__
+    rows = conn.execute(
+        logs.select().with_only_columns(logs.c.id, logs.c.message)
+        .where(logs.c.advisory_type == "crop_health", logs.c.message.startswith(UPLOAD_LOG_PREFIX))
+    ).all()
+    for log_id, message in rows:
+        name = message[len(UPLOAD_LOG_PREFIX):].split(UPLOAD_LOG_SEPARATOR)[0]
+        conn.execute(logs.update().where(logs.c.id == log_id).values(file_name=name))
+    if rows:
+        logging.info(f"Backfilled file_name on {len(rows)} upload advisory rows")
+
+def normalize_timestamps():
+    """
+    Rewrite SQLite timestamps stored without microseconds (CURRENT_TIMESTAMP
+    defaults, earlier backfills, raw inserts) or left NULL in SQLAlchemy's
+    storage format.
+    """
+    if db.engine.dialect.name != "sqlite":
+        return
+    fmt = {"fmt": SQLITE_DATETIME_FORMAT}
+    with db.engine.begin() as conn:
+        for table, column in TIMESTAMP_COLUMNS:
+            fixed = conn.execute(text(
+                f"UPDATE {table} SET {column} = strftime(:fmt, {column}) WHERE length({column}) = 19"
+            ), fmt).rowcount
+            fixed += conn.execute(text(
+                f"UPDATE {table} SET {column} = strftime(:fmt, 'now') WHERE {column} IS NULL"
+            ), fmt).rowcount
+            if fixed:
+                logging.info(f"Normalized {fixed} {table}.{column} values")
+
+def ensure_indexes():
+    """
+    Create model indexes missing from existing tables (create_all only
+    indexes tables it creates).
+    """
+    for model in (FarmProfile, AdvisoryLog):
+        for index in model.__table__.indexes:
+            index.create(bind=db.engine, checkfirst=True)
+
 def run_migrations():
     """
     Run database migrations: create tables if they don't exist.
@@ -21,6 +107,9 @@ def run_migrations():
         try:
             logging.info("Starting migrations...")
             db.create_all()
+            ensure_columns()
+            normalize_timestamps()
+            ensure_indexes()
             logging.info("Migrations applied successfully.")
         except Exception as e:
             logging.error(f"Migration failed: {e}")
@@ -9,7 +9,10 @@ CREATE TABLE farm_profiles (
     acreage FLOAT NOT NULL,
     planting_date VARCHAR(32) NOT NULL,
     soil_type VARCHAR(64),
-    region VARCHAR(128)
+    region VARCHAR(128),
+    -- Bumped whenever the profile or its advisories change (ETag/Last-Modified)
+    version INTEGER NOT NULL DEFAULT 1,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
 -- ---------- ADVISORY LOGS ----------
@@ -18,12 +21,19 @@ CREATE TABLE advisory_logs (
     farm_id INTEGER NOT NULL,
     advisory_type VARCHAR(64) NOT NULL,
     message TEXT NOT NULL,
+    -- Stored upload name on crop_health rows recorded by an image upload
+    file_name VARCHAR(255),
+    -- SQLAlchemy's text format (with microseconds), so raw inserts sort
+    -- correctly against the API's keyset cursor
+    created_at DATETIME NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%f000', 'now')),
     FOREIGN KEY (farm_id) REFERENCES farm_profiles (id) ON DELETE CASCADE
 );
 
 -- ---------- INDEXES ----------
 CREATE INDEX idx_farm_profiles_crop_type ON farm_profiles (crop_type);
-CREATE INDEX idx_advisory_logs_farm_id ON advisory_logs (farm_id);
+CREATE INDEX idx_farm_profiles_region ON farm_profiles (region);
+-- (farm_id, created_at) also serves farm_id-only lookups
+CREATE INDEX idx_advisory_logs_farm_created ON advisory_logs (farm_id, created_at);
 CREATE INDEX idx_advisory_logs_type ON advisory_logs (advisory_type);
 
 -- ---------- SAMPLE DATA (Optional for testing) ----------
@@ -9,27 +9,50 @@ document.addEventListener("DOMContentLoaded", () => {
     const advisoryContainer = document.getElementById("advisoryContainer") || document.getElementById("advisoryList");
     const authForm = document.getElementById("authForm");
 
+    const PAGE_SIZE = 20;
+
     // ---------- Render Advisories ----------
-    function renderAdvisories(advisories) {
-        if (!advisories || advisories.length === 0) {
+    function advisoryCard(a) {
+        return `<div class="advisory-card">
+                <strong>[${a.advisory_type}]</strong> ${a.message}
+            </div>`;
+    }
+
+    function renderAdvisories(advisories, append) {
+        if (!append && (!advisories || advisories.length === 0)) {
             advisoryContainer.innerHTML = "<p>No advisories available yet.</p>";
             return;
         }
-        advisoryContainer.innerHTML = advisories.map(a =>
-            `<div class="advisory-card">
-                <strong>[${a.advisory_type}]</strong> ${a.message}
-            </div>`
-        ).join("");
+        const html = advisories.map(advisoryCard).join("");
+        if (append) {
+            advisoryContainer.insertAdjacentHTML("beforeend", html);
+        } else {
+            advisoryContainer.innerHTML = html;
+        }
+    }
+
+    function renderLoadMore(farmId, cursor) {
+        const existing = document.getElementById("loadMoreAdvisories");
+        if (existing) existing.remove();
+        if (!cursor) return;
+        advisoryContainer.insertAdjacentHTML("afterend",
+            `<button id="loadMoreAdvisories" type="button">Load older advisories</button>`);
+        document.getElementById("loadMoreAdvisories")
+            .addEventListener("click", () => fetchAdvisories(farmId, cursor));
     }
 
     // ---------- Fetch Advisories ----------
-    async function fetchAdvisories(farmId) {
-        advisoryContainer.innerHTML = "<p>Loading advisories...</p>";
+    // Only the newest page is fetched; older pages load on demand.
+    async function fetchAdvisories(farmId, cursor) {
+        if (!cursor) advisoryContainer.innerHTML = "<p>Loading advisories...</p>";
         try {
-            const response = await fetch(`/api/advisory/${farmId}`);
+            const params = new URLSearchParams({ limit: PAGE_SIZE });
+            if (cursor) params.set("cursor", cursor);
+            const response = await fetch(`/api/advisory/${farmId}?${params}`);
             if (!response.ok) throw new Error("Failed to fetch advisories");
-            const advisories = await response.json();
-            renderAdvisories(advisories);
+            const page = await response.json();
+            renderAdvisories(page.advisories, Boolean(cursor));
+            renderLoadMore(farmId, page.next_cursor);
         } catch (err) {
             advisoryContainer.innerHTML = `<p class="error">Error: ${err.message}</p>`;
         }
@@ -30,34 +30,25 @@ document.addEventListener("DOMContentLoaded", () => {
             resultContainer.innerHTML = "<p>Uploading crop image...</p>";
 
             try {
-                // Upload image to backend
-                const response = await fetch("/api/crop-health/upload", {
+                // Upload and analyse the image in a single request
+                const response = await fetch("/api/crop-health/analyze", {
                     method: "POST",
                     body: formData
                 });
 
-                if (!response.ok) throw new Error("Failed to upload crop health data");
-                const result = await response.json();
-
-                resultContainer.innerHTML = `<p>${result.message}</p>`;
-
-                // Call inference endpoint
-                const inferenceResponse = await fetch("/api/crop-health/infer", {
-                    method: "POST",
-                    headers: { "Content-Type": "application/json" },
-                    body: JSON.stringify({ farm_id: farmId, file_name: file.name })
-                });
-
-                if (inferenceResponse.ok) {
-                    const inference = await inferenceResponse.json();
-                    resultContainer.innerHTML += `
+                if (response.ok) {
+                    const inference = await response.json();
+                    resultContainer.innerHTML = `
+                        <p>Crop health image uploaded successfully.</p>
                         <div class="advisory-card">
                             <strong>Status:</strong> ${inference.status}<br>
                             <strong>Confidence:</strong> ${(inference.confidence * 100).toFixed(2)}%
                         </div>
                     `;
+                } else if (response.status === 503) {
+                    resultContainer.innerHTML = "<p class='error'>Inference service unavailable.</p>";
                 } else {
-                    resultContainer.innerHTML += "<p class='error'>Inference service unavailable.</p>";
+                    throw new Error("Failed to upload crop health data");
                 }
             } catch (err) {
                 resultContainer.innerHTML = `<p class='error'>Error: ${err.message}</p>`;